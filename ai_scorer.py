@@ -1,43 +1,59 @@
 # ai_scorer.py
 """AI-powered job relevance scoring using Google Gemini"""
+import asyncio
+import hashlib
 import json
 import re
+import string
 import google.generativeai as genai
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import embedding_gate
+import scoring_cache
+from job_scraper import Job
+
+
+# Precompiled response-parsing regexes (hot on large runs)
+_FENCE_RE = re.compile(r'```(?:json)?\s*|\s*```')
+_SCORE_RE = re.compile(r'"?score"?\s*:\s*(\d+)')
+_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Reused model instances - configure_gemini rewrites global SDK state and
+# GenerativeModel construction allocates a client, so do each once per key
+_CONFIGURED = set()
+_MODEL_CACHE = {}
 
 
 def configure_gemini(api_key: str):
-    """Configure Gemini API"""
-    genai.configure(api_key=api_key)
+    """Configure Gemini API (once per key)"""
+    if api_key not in _CONFIGURED:
+        genai.configure(api_key=api_key)
+        _CONFIGURED.add(api_key)
 
 
-def score_job_relevance(
-    job_data: Dict[str, Any],
-    resume_text: str,
-    api_key: str
-) -> Dict[str, Any]:
+def get_model(api_key: str, name: str = 'gemini-2.5-flash') -> genai.GenerativeModel:
     """
-    Score job relevance using AI
-    
+    Get a cached GenerativeModel for this API key
+
     Args:
-        job_data: Normalized job data
-        resume_text: Candidate's resume text
         api_key: Google API key for Gemini
-        
+        name: Gemini model name
+
     Returns:
-        Scoring data with score, reasoning, matches, etc.
+        Shared GenerativeModel instance
     """
     configure_gemini(api_key)
-    
-    prompt = f"""You are an expert career counselor analyzing job-candidate match.
+    cache_key = (api_key, name)
+    model = _MODEL_CACHE.get(cache_key)
+    if model is None:
+        model = genai.GenerativeModel(name)
+        _MODEL_CACHE[cache_key] = model
+    return model
 
-Job Title: {job_data.get('Title', 'N/A')}
-Company: {job_data.get('Company', 'N/A')}
-Location: {job_data.get('Location', 'N/A')}
-Description: {job_data.get('Description', 'N/A')}
 
-Candidate Resume:
-{resume_text}
+# Static scoring rubric - kept byte-stable so it can be cached as a
+# prompt prefix (explicit Gemini context caching below)
+SCORING_RUBRIC = """You are an expert career counselor analyzing job-candidate match.
 
 Score the match from 0-100 based on:
 - Technical skills match (43%): How well do the candidate's technical skills align with job requirements?
@@ -47,24 +63,161 @@ Score the match from 0-100 based on:
 - Additional qualifications (5%): Certifications, education, soft skills
 
 Provide a detailed analysis and return ONLY valid JSON:
-{{
+{
   "score": <number 0-100>,
   "reasoning": "<2-3 sentences explaining the score>",
   "key_matches": ["<matching skill 1>", "<matching skill 2>", "<matching skill 3>"],
   "missing_skills": ["<missing skill 1>", "<missing skill 2>"],
   "recommendation": "<APPLY if score >= 60, otherwise SKIP>"
-}}"""
+}"""
+
+
+_SECTION_RE = re.compile(r'requirements|qualifications|responsibilities', re.IGNORECASE)
+
+
+def _squeeze_description(desc: str, max_chars: int = 4000) -> str:
+    """
+    Truncate a long job description to a character budget
+
+    Input tokens dominate Gemini cost/latency and LinkedIn descriptions
+    routinely run 3-8KB. Keeps the intro plus the requirements/
+    qualifications section when one appears past the cut.
+
+    Args:
+        desc: Raw job description
+        max_chars: Maximum characters to keep
+
+    Returns:
+        Description within the budget
+    """
+    if not desc or len(desc) <= max_chars:
+        return desc
+
+    half = max_chars // 2
+    match = _SECTION_RE.search(desc, half)
+    if match:
+        return desc[:half] + "\n...\n" + desc[match.start():match.start() + half]
+    return desc[:max_chars]
+
+
+# Prompt templates bound once at import - per-call work is a single
+# substitution, and the static bytes stay identical for prefix caching
+JOB_BLOCK_TMPL = string.Template("""Job Title: $title
+Company: $company
+Location: $location
+Description: $description""")
+
+SCORING_PROMPT_TMPL = string.Template(SCORING_RUBRIC + """
+
+Candidate Resume:
+$resume
+
+$job_block""")
+
+
+def _build_job_block(job_data) -> str:
+    """Build the job-specific (non-cacheable) part of the scoring prompt"""
+    job = Job.from_dict(job_data) if isinstance(job_data, dict) else job_data
+    return JOB_BLOCK_TMPL.substitute(
+        title=job.title,
+        company=job.company,
+        location=job.location,
+        description=_squeeze_description(job.description)
+    )
+
+
+def _build_scoring_prompt(job_data: Dict[str, Any], resume_text: str) -> str:
+    """Build the full scoring prompt (static prefix first, job data last)"""
+    return SCORING_PROMPT_TMPL.substitute(
+        resume=resume_text,
+        job_block=_build_job_block(job_data)
+    )
+
+
+# Context-cache sessions keyed by (api_key, resume hash); None means
+# caching is unavailable for that key (e.g. prompt below minimum size)
+_scoring_sessions = {}
+
+
+def build_scoring_session(resume_text: str, api_key: str, ttl: str = '3600s'):
+    """
+    Create a Gemini model bound to a cached rubric+resume prefix
+
+    Cached input tokens get a ~90% discount and faster time-to-first-token,
+    so across a run of N jobs the resume/rubric is only paid for once.
+
+    Args:
+        resume_text: Candidate's resume text
+        api_key: Google API key for Gemini
+        ttl: Cache lifetime (covers one automation run)
+
+    Returns:
+        GenerativeModel using the cached prefix, or None if explicit
+        caching is unavailable
+    """
+    configure_gemini(api_key)
+
+    key = (api_key, hashlib.sha256(resume_text.encode('utf-8')).hexdigest())
+    if key in _scoring_sessions:
+        return _scoring_sessions[key]
 
     try:
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-        
-        # Parse the response
-        output_text = response.text.strip()
-        
-        # Remove markdown formatting if present
-        output_text = re.sub(r'```json\n?|```\n?', '', output_text).strip()
-        
+        cached_content = genai.caching.CachedContent.create(
+            model='gemini-2.5-flash',
+            system_instruction=SCORING_RUBRIC,
+            contents=[f"Candidate Resume:\n{resume_text}"],
+            ttl=ttl
+        )
+        model = genai.GenerativeModel.from_cached_content(cached_content)
+    except Exception as e:
+        print(f"Context caching unavailable, using full prompts: {e}")
+        model = None
+
+    _scoring_sessions[key] = model
+    return model
+
+
+async def _generate_with_retry(model, prompt: str, max_retries: int = 3):
+    """
+    Call generate_content_async with exponential backoff on rate limits
+
+    Background runs have no real-time latency requirement, so waiting out
+    a 429 beats failing the job.
+
+    Args:
+        model: GenerativeModel to call
+        prompt: Prompt text
+        max_retries: Maximum attempts before giving up
+
+    Returns:
+        Model response
+    """
+    for attempt in range(max_retries):
+        try:
+            return await model.generate_content_async(prompt)
+        except Exception as e:
+            retriable = 'ResourceExhausted' in type(e).__name__ or '429' in str(e)
+            if not retriable or attempt == max_retries - 1:
+                raise
+            wait_time = 2 ** attempt
+            print(f"Gemini rate limited, retrying in {wait_time}s...")
+            await asyncio.sleep(wait_time)
+
+
+def _parse_scoring_response(output_text: str) -> Dict[str, Any]:
+    """Parse and validate a scoring response from Gemini"""
+    try:
+        output_text = output_text.strip()
+
+        # Fast path: grab the first {...} object directly - handles both
+        # markdown fences and commentary Gemini sometimes prepends
+        obj_match = _OBJ_RE.search(output_text)
+        if obj_match:
+            output_text = obj_match.group(0)
+        else:
+            # Remove markdown formatting if present
+            output_text = _FENCE_RE.sub('', output_text).strip()
+
         # Parse JSON
         scoring_data = json.loads(output_text)
         
@@ -87,18 +240,81 @@ Provide a detailed analysis and return ONLY valid JSON:
         print(f"Error parsing AI response: {e}")
         print(f"Response text: {output_text}")
         
-        # Fallback: try to extract score with regex
-        score_match = re.search(r'"?score"?\s*:\s*(\d+)', output_text)
+        # Fallback: try to extract score with regex. Marked so callers
+        # can tell a parse failure from a real judgment about the job.
+        score_match = _SCORE_RE.search(output_text)
         score = int(score_match.group(1)) if score_match else 0
-        
+
         return {
             'score': score,
             'reasoning': 'Failed to parse AI response',
             'recommendation': 'APPLY' if score >= 60 else 'SKIP',
             'key_matches': [],
+            'missing_skills': [],
+            '_parse_failed': True
+        }
+
+
+async def score_job_relevance(
+    job_data: Dict[str, Any],
+    resume_text: str,
+    api_key: str
+) -> Dict[str, Any]:
+    """
+    Score job relevance using AI (async, non-blocking)
+
+    Args:
+        job_data: Normalized job data
+        resume_text: Candidate's resume text
+        api_key: Google API key for Gemini
+
+    Returns:
+        Scoring data with score, reasoning, matches, etc.
+    """
+    # Normalize once - everything below works on attribute access instead
+    # of repeated dict .get lookups with mixed key casings
+    job = Job.from_dict(job_data) if isinstance(job_data, dict) else job_data
+
+    # Stage 1: cheap local vector gate - skip the Gemini call entirely on
+    # obvious mismatches (filters most low-scoring listings at ~zero cost)
+    job_text = f"{job.title} {job.description}"
+    cos = embedding_gate.similarity(resume_text, job_text)
+    if cos is not None and cos < embedding_gate.DEFAULT_THRESHOLD:
+        return {
+            'score': max(int(cos * 100), 0),
+            'reasoning': f'Filtered by vector gate (cosine similarity {cos:.2f})',
+            'recommendation': 'SKIP',
+            'key_matches': [],
             'missing_skills': []
         }
-        
+
+    # Check the response cache - duplicate/cross-posted jobs are common
+    description = job.description if job.description != 'N/A' else ''
+    cache_key = scoring_cache.make_key(resume_text, description)
+    cached = scoring_cache.lookup(cache_key, description)
+    if cached is not None:
+        return cached
+
+    # Stage 2: full Gemini scoring. Prefer a session with the rubric+resume
+    # prefix cached server-side; fall back to sending the full prompt.
+    model = build_scoring_session(resume_text, api_key)
+    if model is not None:
+        prompt = _build_job_block(job)
+    else:
+        model = get_model(api_key)
+        prompt = _build_scoring_prompt(job, resume_text)
+
+    try:
+        response = await _generate_with_retry(model, prompt)
+
+        scoring_data = _parse_scoring_response(response.text)
+        # A parse failure is a transient model hiccup, not a judgment
+        # about the job - caching it would pin the job at its fallback
+        # score for the whole cache TTL
+        if not scoring_data.pop('_parse_failed', False):
+            scoring_cache.store(cache_key, description, scoring_data)
+        return scoring_data
+
     except Exception as e:
         print(f"Error scoring job with AI: {e}")
         return {
@@ -110,7 +326,96 @@ Provide a detailed analysis and return ONLY valid JSON:
         }
 
 
-def generate_cover_letter(
+# Static cover-letter instructions - byte-stable so the instructions +
+# resume prefix can be context-cached across jobs in a run
+COVER_LETTER_INSTRUCTIONS = """Write a compelling, personalized cover letter that emphasizes the candidate's matching skills.
+
+**INSTRUCTIONS:**
+1. Start with ONLY ONE greeting: "Dear [COMPANY] Hiring Team," using the actual company name from the job details (or just "Dear Hiring Team," if no company name)
+2. Write 1 - 2 paragraphs emphasizing the key matching skills from the scoring insights
+3. Provide specific examples of achievements
+4. If any missing skills are trainable, express enthusiasm to learn
+5. Close with "Regards," followed by the candidate's name
+6. DO NOT add any resume links or job URLs in the body - they will be added automatically
+
+**FORMAT:**
+- Start with single greeting line: "Dear [ACTUAL_COMPANY_NAME] Hiring Team," or "Dear Hiring Team,"
+- 1-2 body paragraphs (150 - 200 words)
+- End with "Regards," and candidate name
+- Professional but personable tone
+- No placeholders or brackets
+- HTML format with <p> tags
+- DO NOT include resume or job links in the letter body"""
+
+# Prebuilt cover-letter footers (identical on every call)
+FOOTER_ATTACH = """
+<p><br></p>
+<p><em>I have attached my resume for your review. I look forward to discussing this opportunity further.</em></p>"""
+FOOTER_NO_ATTACH = """
+<p><br></p>
+<p><em>I look forward to discussing this opportunity further.</em></p>"""
+
+LETTER_SUFFIX_TMPL = string.Template("""**JOB DETAILS:**
+Title: $title
+Company: $company
+Location: $location
+Description: $description
+
+**SCORING INSIGHTS:**
+Relevance Score: $score/100
+Key Strengths: $key_matches
+Areas to Address: $missing_skills
+Reasoning: $reasoning""")
+
+LETTER_PROMPT_TMPL = string.Template(COVER_LETTER_INSTRUCTIONS + """
+
+**CANDIDATE RESUME:**
+$resume
+
+$suffix""")
+
+_letter_sessions = {}
+
+
+def build_letter_session(resume_text: str, api_key: str, ttl: str = '3600s'):
+    """
+    Create a Gemini model bound to cached cover-letter instructions + resume
+
+    Same pattern as build_scoring_session: the static prefix is cached once
+    per (api key, resume) and each job only sends its dynamic suffix.
+
+    Args:
+        resume_text: Candidate's resume text
+        api_key: Google API key for Gemini
+        ttl: Cache lifetime (covers one automation run)
+
+    Returns:
+        GenerativeModel using the cached prefix, or None if explicit
+        caching is unavailable
+    """
+    configure_gemini(api_key)
+
+    key = (api_key, hashlib.sha256(resume_text.encode('utf-8')).hexdigest())
+    if key in _letter_sessions:
+        return _letter_sessions[key]
+
+    try:
+        cached_content = genai.caching.CachedContent.create(
+            model='gemini-2.5-flash',
+            system_instruction=COVER_LETTER_INSTRUCTIONS,
+            contents=[f"**CANDIDATE RESUME:**\n{resume_text}"],
+            ttl=ttl
+        )
+        model = genai.GenerativeModel.from_cached_content(cached_content)
+    except Exception as e:
+        print(f"Context caching unavailable, using full prompts: {e}")
+        model = None
+
+    _letter_sessions[key] = model
+    return model
+
+
+async def generate_cover_letter(
     job_data: Dict[str, Any],
     resume_text: str,
     scoring_data: Dict[str, Any],
@@ -120,7 +425,7 @@ def generate_cover_letter(
     attach_resume: bool = True
 ) -> str:
     """
-    Generate personalized cover letter using AI
+    Generate personalized cover letter using AI (async, non-blocking)
     
     Args:
         job_data: Normalized job data
@@ -135,84 +440,90 @@ def generate_cover_letter(
         Generated cover letter in HTML format
     """
     configure_gemini(api_key)
-    
+
+    job = Job.from_dict(job_data) if isinstance(job_data, dict) else job_data
+
+    # Reposted listings are common - reuse a previously generated letter
+    # for the same (job, resume, prompt, model) combination. Scoring
+    # metadata is deliberately left out of the key: it varies between
+    # runs but the letter is substantively determined by job + resume.
+    letter_key = hashlib.sha256('\n'.join((
+        'letter_v1', 'gemini-2.5-flash',
+        job.title, job.company, job.description,
+        resume_text, custom_prompt or '',
+        '1' if attach_resume else '0'
+    )).encode('utf-8')).hexdigest()
+    cached_letter = scoring_cache.lookup_letter(letter_key)
+    if cached_letter is not None:
+        return cached_letter
+
     key_matches = ', '.join(scoring_data.get('key_matches', []))
     missing_skills = ', '.join(scoring_data.get('missing_skills', []))
-    
+
     # Use custom prompt if provided, otherwise use default
     if custom_prompt and custom_prompt.strip():
         # Replace placeholders in custom prompt
         prompt = custom_prompt.format(
-            job_title=job_data.get('Title', 'N/A'),
-            company=job_data.get('Company', 'N/A'),
-            description=job_data.get('Description', 'N/A'),
+            job_title=job.title,
+            company=job.company,
+            description=job.description,
             resume=resume_text,
             score=scoring_data.get('score', 0),
             key_matches=key_matches,
             missing_skills=missing_skills,
             reasoning=scoring_data.get('reasoning', ''),
-            location=job_data.get('Location', 'N/A')
+            location=job.location
         )
+        model = None
     else:
-        # Default prompt
-        prompt = f"""Write a compelling, personalized cover letter that emphasizes the candidate's matching skills.
-
-**SCORING INSIGHTS:**
-Relevance Score: {scoring_data.get('score', 0)}/100
-Key Strengths: {key_matches}
-Areas to Address: {missing_skills}
-Reasoning: {scoring_data.get('reasoning', '')}
-
-**JOB DETAILS:**
-Title: {job_data.get('Title', 'N/A')}
-Company: {job_data.get('Company', 'N/A')}
-Location: {job_data.get('Location', 'N/A')}
-Description: {job_data.get('Description', 'N/A')}
-
-**CANDIDATE RESUME:**
-{resume_text}
-
-**INSTRUCTIONS:**
-1. Start with ONLY ONE greeting: "Dear {job_data.get('Company', '')} Hiring Team," (use the actual company name from job_data, or just "Dear Hiring Team," if no company name)
-2. Write 1 - 2 paragraphs emphasizing the key matching skills ({key_matches})
-3. Provide specific examples of achievements
-4. If any missing skills are trainable, express enthusiasm to learn
-5. Close with "Regards," followed by the candidate's name
-6. DO NOT add any resume links or job URLs in the body - they will be added automatically
+        # Default prompt: static prefix (instructions + resume) first, then
+        # the job-specific suffix, so the prefix caches across jobs
+        dynamic_suffix = LETTER_SUFFIX_TMPL.substitute(
+            title=job.title,
+            company=job.company,
+            location=job.location,
+            description=_squeeze_description(job.description),
+            score=scoring_data.get('score', 0),
+            key_matches=key_matches,
+            missing_skills=missing_skills,
+            reasoning=scoring_data.get('reasoning', '')
+        )
 
-**FORMAT:**
-- Start with single greeting line: "Dear [ACTUAL_COMPANY_NAME] Hiring Team," or "Dear Hiring Team,"
-- 1-2 body paragraphs (150 - 200 words)
-- End with "Regards," and candidate name
-- Professional but personable tone
-- No placeholders or brackets
-- HTML format with <p> tags
-- DO NOT include resume or job links in the letter body"""
+        model = build_letter_session(resume_text, api_key)
+        if model is not None:
+            prompt = dynamic_suffix
+        else:
+            prompt = LETTER_PROMPT_TMPL.substitute(
+                resume=resume_text,
+                suffix=dynamic_suffix
+            )
 
     try:
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-        
+        if model is None:
+            model = get_model(api_key)
+        response = await _generate_with_retry(model, prompt)
+
         cover_letter = response.text.strip()
         
         # Ensure it's in HTML format
         if not cover_letter.startswith('<'):
-            # Wrap paragraphs in <p> tags
-            paragraphs = cover_letter.split('\n\n')
-            cover_letter = '\n'.join(f'<p>{p.strip()}</p>' for p in paragraphs if p.strip())
-        
+            # Wrap paragraphs in <p> tags with a single join instead of
+            # per-paragraph f-string allocations
+            parts = []
+            append = parts.append
+            for paragraph in cover_letter.split('\n\n'):
+                stripped = paragraph.strip()
+                if stripped:
+                    if parts:
+                        append('\n')
+                    append('<p>')
+                    append(stripped)
+                    append('</p>')
+            cover_letter = ''.join(parts)
+
         # Add professional footer based on resume attachment setting
-        if attach_resume:
-            footer = f"""
-<p><br></p>
-<p><em>I have attached my resume for your review. I look forward to discussing this opportunity further.</em></p>"""
-        else:
-            footer = f"""
-<p><br></p>
-<p><em>I look forward to discussing this opportunity further.</em></p>"""
-        
-        cover_letter = cover_letter + footer
-        
+        cover_letter += FOOTER_ATTACH if attach_resume else FOOTER_NO_ATTACH
+        scoring_cache.store_letter(letter_key, cover_letter)
         return cover_letter
         
     except Exception as e:
@@ -231,8 +542,14 @@ def extract_company_domain(company_name: str, api_key: str) -> str:
     Returns:
         Company domain (e.g., 'example.com') or 'UNKNOWN'
     """
+    # Companies repeat across a run - check the local KV before paying
+    # a Gemini round trip
+    cached_domain = scoring_cache.lookup_company_domain(company_name)
+    if cached_domain:
+        return cached_domain
+
     configure_gemini(api_key)
-    
+
     prompt = f"""Extract the company domain from: {company_name}
 
 Return ONLY the domain in format: example.com
@@ -246,7 +563,7 @@ Examples:
 - JPMorgan Chase → jpmorganchase.com"""
 
     try:
-        model = genai.GenerativeModel('gemini-2.5-flash')
+        model = get_model(api_key)
         response = model.generate_content(prompt)
         
         domain = response.text.strip()
@@ -255,7 +572,10 @@ Examples:
         domain = domain.replace('https://', '').replace('http://', '').replace('www.', '')
         domain = domain.split('/')[0]  # Remove any path
         domain = domain.strip()
-        
+
+        if domain and domain != 'UNKNOWN':
+            scoring_cache.store_company_domain(company_name, domain)
+
         return domain if domain else 'UNKNOWN'
         
     except Exception as e:
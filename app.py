@@ -10,9 +10,17 @@ from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 import sqlite3
 import os
+import io
 import json
+import logging
+import logging.handlers
+import queue
+import shutil
 from datetime import datetime
+import asyncio
+import functools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
@@ -21,27 +29,60 @@ import pickle
 
 # Import our automation modules
 from database import JobDatabase
-from job_scraper import scrape_job_list, scrape_job_details, normalize_job_data, check_quality
+from job_scraper import scrape_job_list, scrape_job_details_many, normalize_job_data, check_quality
 from resume_handler import extract_text_from_pdf
 from ai_scorer import score_job_relevance, generate_cover_letter
 from email_finder import find_company_domain_and_emails, find_emails_with_fallback
 from email_sender import send_to_multiple_recipients
+import embedding_gate
+import scoring_cache
+from rate_limiter import HUNTER_LIMITER, GMAIL_SEND_LIMITER
 import time
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-change-this-in-production'
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['CREDENTIALS_FOLDER'] = 'user_credentials'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size (resumes)
+CREDENTIALS_MAX_BYTES = 256 * 1024  # credentials.json is a few KB at most
 
 # Configure Flask to work behind a reverse proxy (Caddy)
 from werkzeug.middleware.proxy_fix import ProxyFix
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1, x_prefix=0)
 
+# Vector-gate similarity above which the cover letter is generated in
+# parallel with scoring (speculatively) instead of after it
+SPECULATIVE_LETTER_THRESHOLD = 0.7
+
+# Automation logging goes through a queue: the hot loop pays a queue.put
+# per record instead of a synchronous, lock-contended stdout write, and a
+# background listener thread does the actual I/O. Messages use lazy
+# %s-formatting so suppressed levels cost nothing.
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler())
+_log_listener.start()
+log = logging.getLogger('automation')
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+log.setLevel(logging.INFO)
+log.propagate = False
+
+# In-process stop signalling: the automation loop checks an Event instead
+# of polling job_runs per job. The stop_requested column remains the
+# fallback for RQ workers in other processes and across restarts.
+STOP_EVENTS = {}
+
 # Database directory
 DATABASE_DIR = 'databases'
 os.makedirs(DATABASE_DIR, exist_ok=True)
 
+
+@functools.lru_cache(maxsize=1024)
+def user_db_path(user_id):
+    """Per-user jobs DB path - cached since it's rebuilt on every
+    /applications view, and a single place to change the layout"""
+    return os.path.join(DATABASE_DIR, f"user_{user_id}_jobs.db")
+
 # Ensure folders exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['CREDENTIALS_FOLDER'], exist_ok=True)
@@ -64,19 +105,68 @@ class User(UserMixin):
         self.name = name
 
 
+# Thread-local users.db connection - reused across requests on the same
+# worker thread instead of paying connect + journal setup per query
+_db_local = threading.local()
+
+# Password hashing runs on this pool so the expensive KDF (which releases
+# the GIL inside hashlib's C code) doesn't serialize other requests on
+# the same worker during concurrent logins
+_hash_pool = ThreadPoolExecutor(max_workers=4)
+
+
 def get_user_db():
-    """Get user database connection"""
-    db_path = os.path.join(DATABASE_DIR, 'users.db')
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    """Get user database connection (thread-local, WAL mode)"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        db_path = os.path.join(DATABASE_DIR, 'users.db')
+        # cached_statements keeps compiled plans for the repeated queries
+        # that dominate the request path
+        conn = sqlite3.connect(db_path, check_same_thread=False,
+                               cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        # WAL allows concurrent readers during a writer; NORMAL sync is
+        # safe in WAL mode and skips a per-commit fsync
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # ~64MB page cache; wait up to 5s on a locked DB instead of
+        # failing immediately when another thread is mid-commit
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        _db_local.conn = conn
     return conn
 
 
+@app.teardown_appcontext
+def _commit_user_db(exception):
+    """Commit pending user-db work at request end (connection stays open)"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is not None:
+        if exception is None:
+            conn.commit()
+        else:
+            conn.rollback()
+
+
+# Bump whenever init_user_db gains a table, column or index so existing
+# databases re-run the migrations exactly once
+USER_DB_SCHEMA_VERSION = 2
+
+
 def init_user_db():
     """Initialize user database"""
     conn = get_user_db()
     cursor = conn.cursor()
-    
+
+    # Skip the DDL entirely when the schema is current - every Gunicorn
+    # worker runs this at import, and re-parsing the statements while
+    # holding the write lock slows rolling restarts
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] == USER_DB_SCHEMA_VERSION:
+        return
+
     # Users table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS users (
@@ -139,6 +229,18 @@ def init_user_db():
         else:
             print(f"Error adding stop_requested column: {e}")
     
+    # Migration: Add materialized dashboard counters to job_runs so the
+    # dashboard can aggregate without opening the per-user jobs database
+    for column_def in ("jobs_skipped INTEGER DEFAULT 0", "emails_sent INTEGER DEFAULT 0"):
+        try:
+            cursor.execute(f"ALTER TABLE job_runs ADD COLUMN {column_def}")
+            print(f"Added {column_def.split()[0]} column to job_runs table")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" in str(e):
+                print(f"{column_def.split()[0]} column already exists")
+            else:
+                print(f"Error adding {column_def.split()[0]} column: {e}")
+
     # Migration: Add custom_cover_letter_prompt column if it doesn't exist
     try:
         cursor.execute("ALTER TABLE user_settings ADD COLUMN custom_cover_letter_prompt TEXT")
@@ -158,27 +260,163 @@ def init_user_db():
             print("attach_resume column already exists")
         else:
             print(f"Error adding attach_resume column: {e}")
-    
+
+    # Migration: Add resume_text column if it doesn't exist
+    # (extracted once at upload so runs skip PDF parsing)
+    try:
+        cursor.execute("ALTER TABLE user_settings ADD COLUMN resume_text TEXT")
+        print("Added resume_text column to user_settings table")
+    except sqlite3.OperationalError as e:
+        if "duplicate column name" in str(e):
+            print("resume_text column already exists")
+        else:
+            print(f"Error adding resume_text column: {e}")
+
+    # Migration: Add resume_embedding column if it doesn't exist
+    try:
+        cursor.execute("ALTER TABLE user_settings ADD COLUMN resume_embedding BLOB")
+        print("Added resume_embedding column to user_settings table")
+    except sqlite3.OperationalError as e:
+        if "duplicate column name" in str(e):
+            print("resume_embedding column already exists")
+        else:
+            print(f"Error adding resume_embedding column: {e}")
+
+    # Indexes for the hot lookups: the dashboard's recent-runs query and
+    # the per-request settings SELECT (users.email is already UNIQUE, so
+    # login/register lookups have an implicit index)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_job_runs_user_started
+        ON job_runs(user_id, started_at DESC)
+    """)
+    # Drop legacy duplicate user_settings rows (keeping the newest per
+    # user) before indexing - the settings UPSERT's ON CONFLICT(user_id)
+    # clause errors out unless the UNIQUE index actually exists, so a
+    # non-unique fallback index is not an option here
+    cursor.execute("""
+        DELETE FROM user_settings
+        WHERE rowid NOT IN (
+            SELECT MAX(rowid) FROM user_settings GROUP BY user_id
+        )
+    """)
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_user_settings_user
+        ON user_settings(user_id)
+    """)
+
+    # Covers the status-filtered queries in run_automation/stop_automation
+    # ("is a run already running?") without a table scan
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_job_runs_user_status_started
+        ON job_runs(user_id, status, started_at DESC)
+    """)
+
+    # Refresh planner statistics so the new indexes actually get used
+    cursor.execute("ANALYZE")
+
+    cursor.execute(f"PRAGMA user_version = {USER_DB_SCHEMA_VERSION}")
     conn.commit()
-    conn.close()
 
 
 # Initialize database on startup (runs when Gunicorn loads the app)
 init_user_db()
 
 
+# Stuck-run cleanup runs on a timer instead of inside dashboard(), so
+# page loads are pure reads and never take the write lock
+_sweep_lock = threading.Lock()
+STUCK_RUN_SWEEP_INTERVAL = 60  # seconds
+
+
+def _cleanup_stuck_runs():
+    """Mark runs stuck in 'running' for over 10 minutes as failed"""
+    if _sweep_lock.acquire(blocking=False):
+        try:
+            conn = get_user_db()
+            conn.execute("""
+                UPDATE job_runs
+                SET status = 'failed', completed_at = CURRENT_TIMESTAMP
+                WHERE status = 'running'
+                AND started_at < datetime('now', '-10 minutes')
+            """)
+            conn.commit()
+        except Exception as e:
+            print(f"Error sweeping stuck runs: {e}")
+        finally:
+            _sweep_lock.release()
+
+    timer = threading.Timer(STUCK_RUN_SWEEP_INTERVAL, _cleanup_stuck_runs)
+    timer.daemon = True
+    timer.start()
+
+
+_cleanup_stuck_runs()
+
+
+# Flask-Login calls load_user on every authenticated request; cache the
+# User objects briefly so repeated page loads skip the SELECT (users rows
+# are immutable after registration, so 60s of staleness is safe)
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+USER_CACHE_TTL = 60  # seconds
+
+
 @login_manager.user_loader
 def load_user(user_id):
     """Load user by ID"""
+    now = time.monotonic()
+    with _user_cache_lock:
+        entry = _user_cache.get(user_id)
+        if entry and now < entry[0]:
+            return entry[1]
+
     conn = get_user_db()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
+    # Only the columns User needs - skips decoding password_hash per hit
+    cursor.execute("SELECT id, email, name FROM users WHERE id = ?", (user_id,))
     user_data = cursor.fetchone()
-    conn.close()
-    
+
+    user = None
     if user_data:
-        return User(user_data['id'], user_data['email'], user_data['name'])
-    return None
+        user = User(user_data['id'], user_data['email'], user_data['name'])
+    with _user_cache_lock:
+        _user_cache[user_id] = (now + USER_CACHE_TTL, user)
+    return user
+
+
+def save_upload_stream(stream, filepath):
+    """
+    Save an upload stream to disk
+
+    Uses sendfile(2) for a zero-copy kernel-side transfer when the stream
+    is backed by a real file descriptor (spooled uploads past Werkzeug's
+    in-memory threshold); otherwise streams through a 1MB buffer so the
+    file never sits fully in worker memory.
+    """
+    with open(filepath, 'wb') as out:
+        try:
+            src_fd = stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            src_fd = None
+
+        if src_fd is not None:
+            offset = 0
+            while True:
+                sent = os.sendfile(out.fileno(), src_fd, offset, 1 << 20)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            shutil.copyfileobj(stream, out, length=1 << 20)
+
+
+@app.before_request
+def enforce_upload_limits():
+    """Per-route upload cap - only resume uploads need the global 16MB"""
+    if (request.endpoint == 'upload_gmail_credentials'
+            and (request.content_length or 0) > CREDENTIALS_MAX_BYTES):
+        flash('Credentials file too large', 'error')
+        return redirect(url_for('settings'))
 
 
 @app.route('/')
@@ -201,32 +439,32 @@ def register():
             flash('All fields are required', 'error')
             return render_template('register.html')
         
+        password_hash = _hash_pool.submit(generate_password_hash, password).result()
+
         conn = get_user_db()
         cursor = conn.cursor()
-        
-        # Check if user exists
-        cursor.execute("SELECT id FROM users WHERE email = ?", (email,))
-        if cursor.fetchone():
-            flash('Email already registered', 'error')
-            conn.close()
-            return render_template('register.html')
-        
-        # Create user
-        password_hash = generate_password_hash(password)
+
+        # Single transaction: INSERT OR IGNORE doubles as the existence
+        # check (email is UNIQUE) and both inserts share one commit
+        if not conn.in_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
         cursor.execute(
-            "INSERT INTO users (email, password_hash, name) VALUES (?, ?, ?)",
+            "INSERT OR IGNORE INTO users (email, password_hash, name) VALUES (?, ?, ?)",
             (email, password_hash, name)
         )
+        if cursor.rowcount == 0:
+            conn.rollback()
+            flash('Email already registered', 'error')
+            return render_template('register.html')
         user_id = cursor.lastrowid
-        
+
         # Create default settings
         cursor.execute(
             "INSERT INTO user_settings (user_id) VALUES (?)",
             (user_id,)
         )
-        
+
         conn.commit()
-        conn.close()
         
         flash('Registration successful! Please login.', 'success')
         return redirect(url_for('login'))
@@ -245,9 +483,9 @@ def login():
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM users WHERE email = ?", (email,))
         user_data = cursor.fetchone()
-        conn.close()
         
-        if user_data and check_password_hash(user_data['password_hash'], password):
+        if user_data and _hash_pool.submit(
+                check_password_hash, user_data['password_hash'], password).result():
             user = User(user_data['id'], user_data['email'], user_data['name'])
             login_user(user)
             flash('Login successful!', 'success')
@@ -262,62 +500,139 @@ def login():
 @login_required
 def logout():
     """User logout"""
+    with _user_cache_lock:
+        _user_cache.pop(str(current_user.id), None)
     logout_user()
     flash('Logged out successfully', 'success')
     return redirect(url_for('index'))
 
 
+# Per-user cache of the user_settings row. Short TTL plus explicit
+# invalidation from every route that mutates settings keeps the common
+# dashboard/automation reads off the database.
+_settings_cache = {}
+_settings_cache_lock = threading.Lock()
+SETTINGS_TTL = 30  # seconds
+
+
+def get_user_settings_cached(user_id):
+    """
+    Get the user_settings row as a dict, cached for SETTINGS_TTL seconds
+
+    Returns:
+        Settings dict, or None when no row exists yet
+    """
+    now = time.time()
+    with _settings_cache_lock:
+        entry = _settings_cache.get(user_id)
+        if entry and now - entry[0] < SETTINGS_TTL:
+            return entry[1]
+
+    cursor = get_user_db().cursor()
+    cursor.execute("SELECT * FROM user_settings WHERE user_id = ?", (user_id,))
+    row = cursor.fetchone()
+    user_settings = dict(row) if row else None
+    with _settings_cache_lock:
+        _settings_cache[user_id] = (now, user_settings)
+    return user_settings
+
+
+def invalidate_settings_cache(user_id):
+    """Drop the cached settings row after a settings mutation"""
+    with _settings_cache_lock:
+        _settings_cache.pop(user_id, None)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_client_config(path, mtime):
+    """
+    Load and cache a parsed OAuth client config
+
+    Keyed by path + mtime so re-uploading credentials.json naturally
+    refreshes the entry; saves a disk read + JSON parse per OAuth step.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_gmail_token(blob):
+    """
+    Decode a stored gmail_token value
+
+    New tokens are stored as JSON; rows written before the switch are
+    pickled, so fall back to pickle for those.
+    """
+    try:
+        return json.loads(blob)
+    except (ValueError, TypeError, UnicodeDecodeError):
+        return pickle.loads(blob)
+
+
+@functools.lru_cache(maxsize=1024)
+def get_dashboard_stats(user_id, stats_key):
+    """
+    Get aggregate stats for the dashboard
+
+    Counters are materialized into job_runs when a run finishes, so this
+    is one SUM over the users.db connection already open for the request
+    instead of opening the per-user jobs database. stats_key is the
+    latest run completion timestamp, so the cached entry is reused until
+    another automation run finishes.
+    """
+    cursor = get_user_db().cursor()
+    cursor.execute("""
+        SELECT
+            COALESCE(SUM(jobs_processed), 0),
+            COALESCE(SUM(applications_sent), 0),
+            COALESCE(SUM(jobs_skipped), 0),
+            COALESCE(SUM(emails_sent), 0)
+        FROM job_runs WHERE user_id = ?
+    """, (user_id,))
+    row = cursor.fetchone()
+    return {
+        'total_jobs': row[0],
+        'applications_sent': row[1],
+        'jobs_skipped': row[2],
+        'emails_sent': row[3]
+    }
+
+
 @app.route('/dashboard')
 @login_required
 def dashboard():
     """User dashboard"""
-    # Get user settings
+    # Get user settings (cached - invalidated by mutating routes)
+    settings = get_user_settings_cached(current_user.id)
     conn = get_user_db()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM user_settings WHERE user_id = ?", (current_user.id,))
-    settings = cursor.fetchone()
-    
-    # Get recent job runs
+
+    # Get recent job runs; the currently-running run (if any) is derived
+    # from the same rows instead of a second SELECT - runs are serialized
+    # per user, so a running run is always the most recent one
     cursor.execute("""
-        SELECT * FROM job_runs 
-        WHERE user_id = ? 
-        ORDER BY started_at DESC 
+        SELECT *,
+               (status = 'running'
+                AND started_at > datetime('now', '-10 minutes')) AS is_current
+        FROM job_runs
+        WHERE user_id = ?
+        ORDER BY started_at DESC
         LIMIT 5
     """, (current_user.id,))
     recent_runs = cursor.fetchall()
-    
-    # Check if automation is currently running (only recent ones, not stuck ones)
-    cursor.execute("""
-        SELECT id, started_at FROM job_runs 
-        WHERE user_id = ? AND status = 'running' AND started_at > datetime('now', '-10 minutes')
-        ORDER BY started_at DESC 
-        LIMIT 1
-    """, (current_user.id,))
-    current_run = cursor.fetchone()
-    
-    # Clean up stuck "running" status runs (older than 10 minutes)
-    cursor.execute("""
-        UPDATE job_runs 
-        SET status = 'failed', completed_at = CURRENT_TIMESTAMP
-        WHERE user_id = ? AND status = 'running' 
-        AND started_at < datetime('now', '-10 minutes')
-    """, (current_user.id,))
-    conn.commit()
-    conn.close()
-    
-    # Get stats from user's job database
-    user_db_path = os.path.join(DATABASE_DIR, f"user_{current_user.id}_jobs.db")
-    if os.path.exists(user_db_path):
-        try:
-            with JobDatabase(user_db_path) as db:
-                stats = db.get_application_stats()
-        except Exception as e:
-            print(f"Error reading user database: {e}")
-            stats = {'total_jobs': 0, 'applications_sent': 0, 'jobs_skipped': 0, 'emails_sent': 0}
-    else:
-        stats = {'total_jobs': 0, 'applications_sent': 0, 'jobs_skipped': 0, 'emails_sent': 0}
-    
-    return render_template('dashboard.html', 
+
+    current_run = next((run for run in recent_runs if run['is_current']), None)
+
+
+    # Get stats from user's job database. Keyed by the latest run
+    # completion so repeated dashboard refreshes hit the LRU cache and
+    # skip opening the job database entirely.
+    stats_key = max(
+        (run['completed_at'] or run['started_at'] for run in recent_runs),
+        default=''
+    )
+    stats = get_dashboard_stats(current_user.id, stats_key)
+
+    return render_template('dashboard.html',
                          settings=settings, 
                          recent_runs=recent_runs,
                          current_run=current_run,
@@ -332,53 +647,62 @@ def settings():
     cursor = conn.cursor()
     
     if request.method == 'POST':
-        
-        # Ensure user_settings row exists (create if doesn't)
-        cursor.execute("SELECT id FROM user_settings WHERE user_id = ?", (current_user.id,))
-        if not cursor.fetchone():
-            cursor.execute("INSERT INTO user_settings (user_id) VALUES (?)", (current_user.id,))
-        
-        # Update settings
+
+        def int_field(name, default):
+            # Form values arrive as strings; store typed integers so the
+            # columns compare and index as numbers
+            try:
+                return int(request.form.get(name) or default)
+            except (TypeError, ValueError):
+                return default
+
+        # Single UPSERT - the UNIQUE user_id index lets one statement
+        # replace the ensure-row SELECT + INSERT + UPDATE trio
         cursor.execute("""
-            UPDATE user_settings SET
-                google_api_key = ?,
-                hunter_api_key = ?,
-                sender_email = ?,
-                sender_name = ?,
-                linkedin_search_url = ?,
-                linkedin_cookie = ?,
-                max_days_posted = ?,
-                max_applicants = ?,
-                min_relevance_score = ?,
-                excluded_companies = ?,
-                custom_prompt = ?,
-                custom_cover_letter_prompt = ?,
-                attach_resume = ?,
+            INSERT INTO user_settings (
+                user_id, google_api_key, hunter_api_key, sender_email,
+                sender_name, linkedin_search_url, linkedin_cookie,
+                max_days_posted, max_applicants, min_relevance_score,
+                excluded_companies, custom_prompt,
+                custom_cover_letter_prompt, attach_resume
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                google_api_key = excluded.google_api_key,
+                hunter_api_key = excluded.hunter_api_key,
+                sender_email = excluded.sender_email,
+                sender_name = excluded.sender_name,
+                linkedin_search_url = excluded.linkedin_search_url,
+                linkedin_cookie = excluded.linkedin_cookie,
+                max_days_posted = excluded.max_days_posted,
+                max_applicants = excluded.max_applicants,
+                min_relevance_score = excluded.min_relevance_score,
+                excluded_companies = excluded.excluded_companies,
+                custom_prompt = excluded.custom_prompt,
+                custom_cover_letter_prompt = excluded.custom_cover_letter_prompt,
+                attach_resume = excluded.attach_resume,
                 updated_at = CURRENT_TIMESTAMP
-            WHERE user_id = ?
         """, (
+            current_user.id,
             request.form.get('google_api_key'),
             request.form.get('hunter_api_key'),
             request.form.get('sender_email'),
             request.form.get('sender_name'),
             request.form.get('linkedin_search_url'),
             request.form.get('linkedin_cookie', ''),
-            request.form.get('max_days_posted', 14),
-            request.form.get('max_applicants', 500),
-            request.form.get('min_relevance_score', 60),
+            int_field('max_days_posted', 14),
+            int_field('max_applicants', 500),
+            int_field('min_relevance_score', 60),
             request.form.get('excluded_companies', ''),
             request.form.get('custom_prompt', ''),
             request.form.get('custom_cover_letter_prompt', ''),
-            1 if request.form.get('attach_resume') else 0,
-            current_user.id
+            1 if request.form.get('attach_resume') else 0
         ))
-        
-        
+
         conn.commit()
+        invalidate_settings_cache(current_user.id)
         flash('Settings updated successfully!', 'success')
         
         # Redirect to GET to prevent form resubmission
-        conn.close()
         return redirect(url_for('settings'))
     
     # GET request - fetch settings
@@ -392,7 +716,6 @@ def settings():
         cursor.execute("SELECT * FROM user_settings WHERE user_id = ?", (current_user.id,))
         user_settings = cursor.fetchone()
     
-    conn.close()
     
     
     return render_template('settings.html', settings=user_settings)
@@ -415,18 +738,41 @@ def upload_resume():
     if file and file.filename.endswith('.pdf'):
         filename = f"user_{current_user.id}_resume.pdf"
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
+        save_upload_stream(file.stream, filepath)
+
+        # Extract text once at upload - PDF parsing is CPU-heavy and the
+        # resume only changes here, so runs can skip it entirely
+        resume_text = ''
+        try:
+            with open(filepath, 'rb') as f:
+                resume_text = extract_text_from_pdf(f.read())
+        except Exception as e:
+            print(f"Error extracting resume text at upload: {e}")
+
+        # Precompute the embedding for the vector gate while we're at it
+        resume_embedding = None
+        if resume_text and embedding_gate.gate_available():
+            try:
+                emb = embedding_gate.get_resume_embedding(
+                    resume_text,
+                    cache_path=os.path.join(app.config['UPLOAD_FOLDER'],
+                                            f"user_{current_user.id}_resume.emb")
+                )
+                if emb is not None:
+                    resume_embedding = emb.astype('float32').tobytes()
+            except Exception as e:
+                print(f"Error computing resume embedding at upload: {e}")
+
         # Update settings
         conn = get_user_db()
         cursor = conn.cursor()
         cursor.execute(
-            "UPDATE user_settings SET resume_filename = ? WHERE user_id = ?",
-            (filename, current_user.id)
+            "UPDATE user_settings SET resume_filename = ?, resume_text = ?, resume_embedding = ? WHERE user_id = ?",
+            (filename, resume_text, resume_embedding, current_user.id)
         )
         conn.commit()
-        conn.close()
-        
+        invalidate_settings_cache(current_user.id)
+
         flash('Resume uploaded successfully!', 'success')
     else:
         flash('Please upload a PDF file', 'error')
@@ -461,10 +807,11 @@ def upload_gmail_credentials():
             # Save credentials for this user
             filename = f"user_{current_user.id}_credentials.json"
             filepath = os.path.join(app.config['CREDENTIALS_FOLDER'], filename)
-            
-            # Reset file pointer and save
-            file.seek(0)
-            file.save(filepath)
+
+            # Write the dict we already parsed instead of re-reading the
+            # upload stream (also avoids parse-then-save divergence)
+            with open(filepath, 'w') as f:
+                json.dump(credentials_data, f)
             
             # Update database
             conn = get_user_db()
@@ -474,8 +821,8 @@ def upload_gmail_credentials():
                 (filename, current_user.id)
             )
             conn.commit()
-            conn.close()
-            
+            invalidate_settings_cache(current_user.id)
+
             flash('Gmail credentials uploaded! Now click "Authorize Gmail" to complete setup.', 'success')
         except json.JSONDecodeError:
             flash('Invalid JSON file', 'error')
@@ -491,18 +838,14 @@ def upload_gmail_credentials():
 @login_required
 def authorize_gmail():
     """Initiate Gmail OAuth flow"""
-    # Get user's credentials file
-    conn = get_user_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT gmail_credentials FROM user_settings WHERE user_id = ?", (current_user.id,))
-    result = cursor.fetchone()
-    conn.close()
-    
-    if not result or not result['gmail_credentials']:
+    # Get user's credentials file (cached settings row)
+    user_settings = get_user_settings_cached(current_user.id)
+
+    if not user_settings or not user_settings.get('gmail_credentials'):
         flash('Please upload credentials.json first', 'error')
         return redirect(url_for('settings'))
-    
-    credentials_path = os.path.join(app.config['CREDENTIALS_FOLDER'], result['gmail_credentials'])
+
+    credentials_path = os.path.join(app.config['CREDENTIALS_FOLDER'], user_settings['gmail_credentials'])
     
     if not os.path.exists(credentials_path):
         flash('Credentials file not found. Please upload again.', 'error')
@@ -515,8 +858,8 @@ def authorize_gmail():
             redirect_uri = redirect_uri.replace('http://', 'https://')
         print(f"DEBUG: Gmail redirect URI: {redirect_uri}")
         
-        flow = Flow.from_client_secrets_file(
-            credentials_path,
+        flow = Flow.from_client_config(
+            _load_client_config(credentials_path, os.path.getmtime(credentials_path)),
             scopes=SCOPES,
             redirect_uri=redirect_uri
         )
@@ -554,7 +897,6 @@ def gmail_callback():
     result = cursor.fetchone()
     
     if not result or not result['gmail_credentials']:
-        conn.close()
         flash('Credentials not found', 'error')
         return redirect(url_for('settings'))
     
@@ -566,8 +908,8 @@ def gmail_callback():
         if redirect_uri.startswith('http://'):
             redirect_uri = redirect_uri.replace('http://', 'https://')
         
-        flow = Flow.from_client_secrets_file(
-            credentials_path,
+        flow = Flow.from_client_config(
+            _load_client_config(credentials_path, os.path.getmtime(credentials_path)),
             scopes=SCOPES,
             state=state,
             redirect_uri=redirect_uri
@@ -594,10 +936,10 @@ def gmail_callback():
             UPDATE user_settings 
             SET gmail_token = ?, gmail_authenticated = 1, updated_at = CURRENT_TIMESTAMP
             WHERE user_id = ?
-        """, (pickle.dumps(creds_data), user_id))
+        """, (json.dumps(creds_data), user_id))
         conn.commit()
-        conn.close()
-        
+        invalidate_settings_cache(user_id)
+
         # Clear session
         session.pop('oauth_state', None)
         session.pop('oauth_user_id', None)
@@ -606,7 +948,6 @@ def gmail_callback():
         return redirect(url_for('settings'))
         
     except Exception as e:
-        conn.close()
         flash(f'Error completing authorization: {str(e)}', 'error')
         return redirect(url_for('settings'))
 
@@ -624,7 +965,7 @@ def revoke_gmail():
     if result and result['gmail_token']:
         try:
             import requests
-            creds_data = pickle.loads(result['gmail_token'])
+            creds_data = load_gmail_token(result['gmail_token'])
             if 'token' in creds_data and creds_data['token']:
                 # Revoke the token with Google
                 revoke_url = 'https://oauth2.googleapis.com/revoke'
@@ -641,8 +982,9 @@ def revoke_gmail():
         WHERE user_id = ?
     """, (current_user.id,))
     conn.commit()
-    conn.close()
-    
+    invalidate_settings_cache(current_user.id)
+    invalidate_gmail_service(current_user.id)
+
     flash('Gmail authorization revoked. You can now re-authorize with the correct scopes.', 'info')
     return redirect(url_for('settings'))
 
@@ -659,7 +1001,6 @@ def run_automation():
         (current_user.id,)
     )
     if cursor.fetchone():
-        conn.close()
         flash('Automation is already running!', 'warning')
         return redirect(url_for('dashboard'))
     
@@ -677,15 +1018,25 @@ def run_automation():
     )
     run_id = cursor.lastrowid
     conn.commit()
-    conn.close()
-    
-    # Start automation in background thread
-    thread = threading.Thread(
-        target=run_automation_task,
-        args=(current_user.id, run_id)
-    )
-    thread.daemon = True
-    thread.start()
+
+    STOP_EVENTS[run_id] = threading.Event()
+
+    # Prefer an out-of-process RQ worker so automation doesn't compete
+    # with Flask under the GIL; fall back to a background thread when
+    # Redis isn't available
+    from tasks import get_queue
+    queue = get_queue()
+    if queue is not None:
+        queue.enqueue('tasks.run_automation_task', current_user.id, run_id,
+                      job_timeout=3600)
+        print(f"User {current_user.id}: Automation run {run_id} enqueued on RQ")
+    else:
+        thread = threading.Thread(
+            target=run_automation_task,
+            args=(current_user.id, run_id)
+        )
+        thread.daemon = True
+        thread.start()
     
     flash('Automation started! Check back soon for results.', 'success')
     return redirect(url_for('dashboard'))
@@ -706,7 +1057,11 @@ def stop_automation():
     run = cursor.fetchone()
     
     if run:
-        # Mark as stop requested
+        # Signal the in-process loop immediately; the DB flag persists the
+        # request for out-of-process workers and across restarts
+        event = STOP_EVENTS.get(run[0])
+        if event is not None:
+            event.set()
         cursor.execute(
             "UPDATE job_runs SET stop_requested = 1 WHERE id = ?",
             (run[0],)
@@ -722,95 +1077,190 @@ def stop_automation():
         conn.commit()
         flash('No active automation found. Any stuck runs have been cleaned up.', 'warning')
     
-    conn.close()
     return redirect(url_for('dashboard'))
 
 
 def should_apply_to_job(job_data, settings):
     """Check if job meets quality criteria"""
     try:
-        # Check if company is excluded
-        excluded_companies = settings.get('excluded_companies', '').lower().split(',')
-        company = job_data.get('company', '').lower().strip()
-        if company in excluded_companies:
+        # Cheapest checks first: plain integer comparisons before the
+        # company-set lookup (which needs a lower/strip on the name)
+        days_posted = job_data.get('days_posted')
+        if days_posted is not None and days_posted > settings.get('max_days_posted', 14):
             return False
-        
-        # Check job age
-        max_days = settings.get('max_days_posted', 14)
-        if 'days_posted' in job_data and job_data['days_posted'] > max_days:
+
+        applicant_count = job_data.get('applicant_count')
+        if applicant_count is not None and applicant_count > settings.get('max_applicants', 500):
             return False
-        
-        # Check applicant count
-        max_applicants = settings.get('max_applicants', 500)
-        if 'applicant_count' in job_data and job_data['applicant_count'] > max_applicants:
+
+        # Check if company is excluded (prebuilt O(1) set when the run
+        # loop precomputed it; fall back to building one here)
+        excluded = settings.get('_excluded_set')
+        if excluded is None:
+            excluded = frozenset(
+                s.strip()
+                for s in (settings.get('excluded_companies') or '').lower().split(',')
+                if s.strip()
+            )
+        if job_data.get('company', '').lower().strip() in excluded:
             return False
-        
+
         return True
     except Exception as e:
         print(f"Error checking job quality: {e}")
         return False
 
 
-def score_job_with_ai(job_data, resume_text, google_api_key):
+async def score_job_with_ai(job_data, resume_text, google_api_key):
     """Score job relevance using AI"""
     try:
-        return score_job_relevance(job_data, resume_text, google_api_key)
+        return await score_job_relevance(job_data, resume_text, google_api_key)
     except Exception as e:
         print(f"Error scoring job: {e}")
         return 0
 
 
+# Repeat employers are common across runs; memoize Hunter.io lookups in
+# memory with a persistent tier (incl. negative caching) in scoring_cache
+_hunter_memo = {}
+_hunter_memo_lock = threading.Lock()
+
+
 def find_company_domain_and_email(company_name, hunter_api_key, google_api_key=None):
     """Find company domain and HR email using comprehensive strategies"""
+    memo_key = (company_name or '').strip().lower()
+
+    with _hunter_memo_lock:
+        if memo_key in _hunter_memo:
+            return _hunter_memo[memo_key]
+
+    cached = scoring_cache.lookup_hunter(memo_key)
+    if cached is not None:
+        with _hunter_memo_lock:
+            _hunter_memo[memo_key] = cached
+        return cached
+
     try:
-        # Use the enhanced email finder function
+        # Use the enhanced email finder function (cache misses only, so
+        # the limiter never throttles repeat companies)
+        HUNTER_LIMITER.acquire()
         result = find_company_domain_and_emails(company_name, hunter_api_key, google_api_key=google_api_key)
-        
+
         if result and result.get('emails'):
             # Return the domain and first email found
             domain = result.get('domain', '')
             email = result['emails'][0]  # Get first email from list
             print(f"  Found email: {email} for {company_name}")
-            return domain, email
-        
-        print(f"  No emails found for {company_name}")
-        return '', ''
+        else:
+            print(f"  No emails found for {company_name}")
+            domain, email = '', ''
+
+        # Cache the outcome either way - empty results use the short
+        # negative TTL so dead companies aren't re-queried every run
+        scoring_cache.store_hunter(memo_key, domain, email)
+        with _hunter_memo_lock:
+            _hunter_memo[memo_key] = (domain, email)
+        return domain, email
     except Exception as e:
         print(f"Error finding company email: {e}")
         return '', ''
 
 
-def send_application_email(sender_email, sender_name, hr_email, job_title, company, cover_letter, settings):
-    """Send application email with resume attachment using Gmail API"""
+# Per-user Gmail service cache - building a service re-reads the token,
+# rebuilds Credentials and parses the discovery document, none of which
+# changes between sends in a run
+_gmail_service_cache = {}
+_gmail_service_lock = threading.Lock()
+GMAIL_SERVICE_TTL = 600  # seconds; tokens live ~1h, refresh well before
+
+
+def get_gmail_service(settings):
+    """Build an authorized Gmail service for the user, or None (cached)"""
+    user_id = settings.get('user_id', 1)
+    now = time.monotonic()
+    with _gmail_service_lock:
+        entry = _gmail_service_cache.get(user_id)
+        if entry and now < entry[0]:
+            return entry[1]
+
+    service = _build_gmail_service(settings)
+    if service is not None:
+        with _gmail_service_lock:
+            _gmail_service_cache[user_id] = (now + GMAIL_SERVICE_TTL, service)
+    return service
+
+
+def invalidate_gmail_service(user_id):
+    """Drop the cached Gmail service (e.g. after revoking authorization)"""
+    with _gmail_service_lock:
+        _gmail_service_cache.pop(user_id, None)
+
+
+def _build_gmail_service(settings):
+    """Build an authorized Gmail service for the user, or None"""
     try:
         # Get Gmail credentials
         conn = get_user_db()
         cursor = conn.cursor()
         cursor.execute("SELECT gmail_token FROM user_settings WHERE user_id = ?", (settings.get('user_id', 1),))
         result = cursor.fetchone()
-        conn.close()
-        
+
         if not result or not result['gmail_token']:
             print("No Gmail token found")
-            return False
-        
+            return None
+
         # Load credentials
-        creds_data = pickle.loads(result['gmail_token'])
-        
+        creds_data = load_gmail_token(result['gmail_token'])
+
         # Create credentials object
         from google.oauth2.credentials import Credentials
         creds = Credentials.from_authorized_user_info(creds_data, SCOPES)
-        
+
         # Refresh credentials if needed
         if not creds.valid:
             if creds.expired and creds.refresh_token:
                 creds.refresh(Request())
             else:
                 print("Credentials are invalid and cannot be refreshed")
-                return False
-        
-        service = build('gmail', 'v1', credentials=creds)
-        
+                return None
+
+        # static_discovery reads the discovery document from the installed
+        # package instead of fetching it over HTTP
+        return build('gmail', 'v1', credentials=creds,
+                     cache_discovery=False, static_discovery=True)
+    except Exception as e:
+        print(f"Error building Gmail service: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _resume_attachment(resume_path, mtime, filename):
+    """
+    Build (and cache) the base64-encoded resume attachment part
+
+    The resume bytes never change within a run, so the file read and
+    base64 encoding happen once per file version instead of once per
+    email. Keyed by mtime so a re-upload refreshes the entry.
+    """
+    import email.mime.base
+    import email.encoders
+
+    with open(resume_path, 'rb') as f:
+        resume_data = f.read()
+
+    part = email.mime.base.MIMEBase('application', 'pdf')
+    part.set_payload(resume_data)
+    email.encoders.encode_base64(part)
+    part.add_header(
+        'Content-Disposition',
+        f'attachment; filename="{filename}"'
+    )
+    return part
+
+
+def build_application_email(sender_email, sender_name, hr_email, job_title, company, cover_letter, settings):
+    """Build the raw (base64url) application email, or None on error"""
+    try:
         # Check if resume should be attached
         attach_resume = settings.get('attach_resume', 1)  # Default to True for backward compatibility
         
@@ -829,205 +1279,411 @@ def send_application_email(sender_email, sender_name, hr_email, job_title, compa
         html_part = email.mime.text.MIMEText(cover_letter, 'html')
         msg.attach(html_part)
         
-        # Add resume as attachment only if enabled
+        # Add resume as attachment only if enabled (cached - encoded once
+        # per file version, not once per email)
         if attach_resume:
-            # Get resume file path
             resume_path = os.path.join(app.config['UPLOAD_FOLDER'], settings['resume_filename'])
             if not os.path.exists(resume_path):
                 print(f"Resume file not found: {resume_path}")
-                return False
-            
-            # Read resume file
-            with open(resume_path, 'rb') as f:
-                resume_data = f.read()
-            
-            # Add resume as attachment
-            resume_attachment = email.mime.base.MIMEBase('application', 'pdf')
-            resume_attachment.set_payload(resume_data)
-            import email.encoders
-            email.encoders.encode_base64(resume_attachment)
-            resume_attachment.add_header(
-                'Content-Disposition',
-                f'attachment; filename="{settings["resume_filename"]}"'
-            )
-            msg.attach(resume_attachment)
+                return None
+
+            msg.attach(_resume_attachment(
+                resume_path,
+                os.path.getmtime(resume_path),
+                settings['resume_filename']
+            ))
         
         # Encode message
         import base64
-        raw_message = base64.urlsafe_b64encode(msg.as_bytes()).decode('utf-8')
-        
-        # Send email
+        return base64.urlsafe_b64encode(msg.as_bytes()).decode('utf-8')
+    except Exception as e:
+        print(f"Error building email: {e}")
+        return None
+
+
+def send_application_email(sender_email, sender_name, hr_email, job_title, company, cover_letter, settings):
+    """Send a single application email using the Gmail API"""
+    raw_message = build_application_email(
+        sender_email, sender_name, hr_email, job_title, company,
+        cover_letter, settings
+    )
+    if raw_message is None:
+        return False
+
+    service = get_gmail_service(settings)
+    if service is None:
+        return False
+
+    try:
         message = service.users().messages().send(
             userId='me',
             body={'raw': raw_message}
         ).execute()
-        
-        if attach_resume:
-            print(f"  Email sent successfully with resume attachment: {message.get('id')}")
-        else:
-            print(f"  Email sent successfully (cover letter only): {message.get('id')}")
+        print(f"  Email sent successfully: {message.get('id')}")
         return True
     except Exception as e:
         print(f"Error sending email: {e}")
         return False
 
 
+GMAIL_BATCH_SIZE = 50  # safely under the API's 100-call batch cap
+
+
+def flush_gmail_batch(service, pending_sends):
+    """
+    Send buffered messages through the Gmail batch endpoint
+
+    One HTTPS round trip covers up to GMAIL_BATCH_SIZE sends; 429s are
+    retried with exponential backoff.
+
+    Args:
+        service: Authorized Gmail service
+        pending_sends: List of dicts with a 'raw' base64url message
+
+    Returns:
+        List of the pending_sends entries that were sent successfully
+    """
+    sent = []
+
+    for start in range(0, len(pending_sends), GMAIL_BATCH_SIZE):
+        retry = pending_sends[start:start + GMAIL_BATCH_SIZE]
+
+        for attempt in range(3):
+            rate_limited = []
+            chunk = retry
+
+            def on_send(request_id, response, exception,
+                        chunk=chunk, rate_limited=rate_limited):
+                # Auto-assigned batch ids are '1'-based add order
+                entry = chunk[int(request_id) - 1]
+                if exception is None:
+                    sent.append(entry)
+                elif '429' in str(exception) or 'rateLimitExceeded' in str(exception):
+                    rate_limited.append(entry)
+                else:
+                    print(f"Batch send failed for {entry.get('hr_email')}: {exception}")
+
+            try:
+                # Pace sends through the token bucket instead of a fixed
+                # sleep - a batch of N consumes N tokens up front
+                GMAIL_SEND_LIMITER.acquire(len(chunk))
+                batch = service.new_batch_http_request(callback=on_send)
+                for entry in chunk:
+                    batch.add(service.users().messages().send(
+                        userId='me', body={'raw': entry['raw']}
+                    ))
+                batch.execute()
+            except Exception as e:
+                print(f"Batch execute failed: {e}")
+                break
+
+            if not rate_limited:
+                break
+            retry = rate_limited
+            time.sleep(2 ** attempt)
+        else:
+            print(f"Dropped {len(retry)} rate-limited sends after retries")
+
+    return sent
+
+
+@functools.lru_cache(maxsize=64)
+def _extract_resume_text_cached(resume_path, mtime, size):
+    """
+    Extract PDF text, cached per file version
+
+    The pre-migration fallback path re-parsed the resume on every run
+    even though the file rarely changes; keying on mtime + size makes the
+    parse a one-time cost per upload.
+    """
+    with open(resume_path, 'rb') as f:
+        return extract_text_from_pdf(f.read())
+
+
 def run_automation_task(user_id, run_id):
-    """Background task to run automation"""
+    """Background task to run automation (thread runs its own asyncio loop)"""
     try:
-        # Get user settings
-        conn = get_user_db()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM user_settings WHERE user_id = ?", (user_id,))
-        settings = dict(cursor.fetchone())
+        asyncio.run(_run_automation_async(user_id, run_id))
+    finally:
+        STOP_EVENTS.pop(run_id, None)
+
+
+async def _run_automation_async(user_id, run_id):
+    """Async automation pipeline - fans out Gemini calls with asyncio.gather"""
+    try:
+        # Get user settings (cached)
+        settings = dict(get_user_settings_cached(user_id))
         settings['user_id'] = user_id  # Add user_id to settings
-        conn.close()
-        
-        # Check if required settings are configured
-        if not settings.get('linkedin_search_url'):
-            print(f"User {user_id}: No LinkedIn search URL configured")
-            return
-        
-        if not settings.get('google_api_key'):
-            print(f"User {user_id}: No Google API key configured")
-            return
-            
-        if not settings.get('hunter_api_key'):
-            print(f"User {user_id}: No Hunter API key configured")
+
+        # Precompute per-run filter inputs once instead of per job: an
+        # O(1) exclusion set, and numeric thresholds as real ints (older
+        # rows may hold TEXT values from unconverted form posts)
+        settings['_excluded_set'] = frozenset(
+            s.strip()
+            for s in (settings.get('excluded_companies') or '').lower().split(',')
+            if s.strip()
+        )
+        for key, default in (('max_days_posted', 14),
+                             ('max_applicants', 500),
+                             ('min_relevance_score', 60)):
+            try:
+                settings[key] = int(settings.get(key) or default)
+            except (TypeError, ValueError):
+                settings[key] = default
+        
+        # Check required settings in one pass, reporting every missing
+        # value at once so the user fixes them in one trip instead of
+        # rediscovering them a failed run at a time
+        required = (
+            ('linkedin_search_url', 'No LinkedIn search URL configured'),
+            ('google_api_key', 'No Google API key configured'),
+            ('hunter_api_key', 'No Hunter API key configured'),
+            ('sender_email', 'No sender email configured'),
+        )
+        missing = [msg for key, msg in required if not settings.get(key)]
+        if missing:
+            for msg in missing:
+                log.info("User %s: %s", user_id, msg)
             return
         
         # Initialize user's database
-        user_db_path = os.path.join(DATABASE_DIR, f"user_{user_id}_jobs.db")
-        
+        db_path = user_db_path(user_id)
+
         # Ensure the databases directory exists
         os.makedirs(DATABASE_DIR, exist_ok=True)
-        print(f"User {user_id}: Creating database at {user_db_path}")
-        
-        db = JobDatabase(user_db_path)
-        print(f"User {user_id}: Database created successfully")
-        
-        # Get resume text
-        resume_path = os.path.join(app.config['UPLOAD_FOLDER'], settings['resume_filename'])
-        if not os.path.exists(resume_path):
-            print(f"User {user_id}: Resume file not found at {resume_path}")
-            return
-            
-        with open(resume_path, 'rb') as f:
-            resume_text = extract_text_from_pdf(f.read())
+        log.info("User %s: Creating database at %s", user_id, db_path)
+
+        db = JobDatabase(db_path)
+        log.info("User %s: Database created successfully", user_id)
         
-        print(f"User {user_id}: Starting job scraping...")
+        # Get resume text - prefer the copy extracted at upload time,
+        # falling back to parsing the PDF for pre-migration uploads
+        resume_text = settings.get('resume_text')
+        if not resume_text:
+            resume_path = os.path.join(app.config['UPLOAD_FOLDER'], settings['resume_filename'])
+            if not os.path.exists(resume_path):
+                log.info("User %s: Resume file not found at %s", user_id, resume_path)
+                return
+
+            resume_text = _extract_resume_text_cached(
+                resume_path,
+                os.path.getmtime(resume_path),
+                os.path.getsize(resume_path)
+            )
+
+        # Precompute the resume embedding once per run for the vector gate
+        if embedding_gate.gate_available():
+            embedding_gate.get_resume_embedding(
+                resume_text,
+                cache_path=os.path.join(app.config['UPLOAD_FOLDER'], f"user_{user_id}_resume.emb")
+            )
+
+        log.info("User %s: Starting job scraping...", user_id)
         
         # Scrape jobs
         linkedin_cookie = settings.get('linkedin_cookie')
         job_urls = scrape_job_list(settings['linkedin_search_url'], linkedin_cookie)
         
-        print(f"User {user_id}: Found {len(job_urls)} job URLs")
+        log.info("User %s: Found %d job URLs", user_id, len(job_urls))
         
         jobs_processed = 0
         applications_sent = 0
         jobs_skipped = 0
-        
-        # Process each job
-        for i, job_url in enumerate(job_urls[:20]):  # Limit to 20 jobs
-            try:
+
+        stop_event = STOP_EVENTS.get(run_id)
+
+        def stop_requested_now():
+            # Fast path: in-process Event set by /stop_automation. RQ
+            # workers live in another process where the event doesn't
+            # exist, so they fall back to polling the DB flag.
+            if stop_event is not None:
+                return stop_event.is_set()
+            cursor = get_user_db().cursor()
+            cursor.execute(
+                "SELECT stop_requested FROM job_runs WHERE id = ?",
+                (run_id,)
+            )
+            row = cursor.fetchone()
+            return bool(row and row[0])
+
+        # Preload applied URLs once - one SELECT instead of a round trip
+        # per job in the loop below
+        applied_urls = db.get_all_applied_urls()
+
+        # Phase 1: Scrape and filter candidate jobs. Detail pages are
+        # fetched concurrently - the wait is network-bound, so the pool
+        # collapses the serial round trips while LINKEDIN_LIMITER keeps
+        # the request rate below LinkedIn's 429 threshold.
+        candidates = []
+        pending_urls = []
+        for job_url in job_urls[:20]:  # Limit to 20 jobs
+            if job_url in applied_urls:
+                log.info("User %s: Job already applied to, skipping", user_id)
+                jobs_skipped += 1
+                continue
+            pending_urls.append(job_url)
+
+        if stop_requested_now():
+            log.info("User %s: Stop requested, ending automation", user_id)
+            pending_urls = []
+
+        if pending_urls:
+            log.info("User %s: Scraping %d job detail pages", user_id, len(pending_urls))
+            details = scrape_job_details_many(pending_urls, linkedin_cookie)
+            for job_url, job_data in zip(pending_urls, details):
                 # Check for stop request before processing each job
-                conn = get_user_db()
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT stop_requested FROM job_runs WHERE id = ?",
-                    (run_id,)
-                )
-                stop_requested = cursor.fetchone()
-                conn.close()
-                
-                if stop_requested and stop_requested[0]:
-                    print(f"User {user_id}: Stop requested, ending automation")
+                if stop_requested_now():
+                    log.info("User %s: Stop requested, ending automation", user_id)
                     break
-                
-                print(f"User {user_id}: Processing job {i+1}/{min(len(job_urls), 20)}: {job_url}")
-                
-                # Check if already applied
-                if db.job_already_applied(job_url):
-                    print(f"User {user_id}: Job already applied to, skipping")
-                    jobs_skipped += 1
-                    continue
-                
-                # Scrape job details
-                try:
-                    job_data = scrape_job_details(job_url, linkedin_cookie)
-                    if not job_data:
-                        print(f"User {user_id}: Failed to scrape job details")
-                        jobs_skipped += 1
-                        continue
-                except Exception as e:
-                    print(f"User {user_id}: Error scraping job details from {job_url}: {e}")
+
+                if not job_data or job_data.get('error'):
+                    log.info("User %s: Failed to scrape job details from %s",
+                             user_id, job_url)
                     jobs_skipped += 1
-                    # Add delay after rate limiting errors
-                    if "429" in str(e):
-                        print(f"User {user_id}: Rate limited, waiting 5 seconds...")
-                        time.sleep(5)
                     continue
-                
+
                 jobs_processed += 1
-                
+
                 # Apply filters
                 if not should_apply_to_job(job_data, settings):
-                    print(f"User {user_id}: Job filtered out")
+                    log.info("User %s: Job filtered out", user_id)
                     jobs_skipped += 1
                     continue
-                
-                # Score job with AI
-                score_result = score_job_with_ai(job_data, resume_text, settings['google_api_key'])
-                
+
+                candidates.append(job_data)
+
+        # Phase 2: Score and apply to candidates concurrently. Gemini calls
+        # are network-bound, so fan them out with asyncio.gather gated by a
+        # semaphore to stay under rate limits.
+        semaphore = asyncio.Semaphore(20)
+        pending_applications = []
+        pending_sends = []
+
+        # The email-finder and Gmail-send calls are blocking; run them on a
+        # thread pool so concurrent jobs don't serialize on them
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=16)
+
+        async def process_job(job_data):
+            nonlocal applications_sent, jobs_skipped
+            job_url = job_data.get('job_url', '')
+            try:
+                # Check for stop request before each job
+                if stop_requested_now():
+                    log.info("User %s: Stop requested, skipping remaining job", user_id)
+                    return
+
+                # Create resume URL - use a more reliable approach
+                resume_url = f"Resume attached as PDF file"
+
+                async def _score():
+                    async with semaphore:
+                        return await score_job_with_ai(
+                            job_data, resume_text, settings['google_api_key']
+                        )
+
+                # Pipelining: when the local vector gate is confident the job
+                # will pass, start the cover letter alongside the scoring call
+                # instead of strictly after it - the letter prompt depends on
+                # resume + job, not on the scoring reasoning, so we only need
+                # a placeholder score. Saves one Gemini round trip per
+                # accepted job; a letter for a job that ends up SKIPped is
+                # simply discarded.
+                speculative_letter = None
+                gate_cos = embedding_gate.similarity(
+                    resume_text,
+                    f"{job_data.get('title', '')} {job_data.get('description', '')}"
+                )
+                if gate_cos is not None and gate_cos > SPECULATIVE_LETTER_THRESHOLD:
+                    placeholder_scoring = {
+                        'score': int(gate_cos * 100),
+                        'reasoning': 'AI-generated cover letter',
+                        'key_matches': [],
+                        'missing_skills': []
+                    }
+
+                    async def _letter():
+                        async with semaphore:
+                            return await generate_cover_letter(
+                                job_data,
+                                resume_text,
+                                placeholder_scoring,
+                                settings['google_api_key'],
+                                resume_url,
+                                settings.get('custom_cover_letter_prompt'),
+                                bool(settings.get('attach_resume', 1))
+                            )
+
+                    score_result, speculative_letter = await asyncio.gather(
+                        _score(), _letter()
+                    )
+                else:
+                    score_result = await _score()
+
                 # Handle both dict and int return types
                 if isinstance(score_result, dict):
                     relevance_score = score_result.get('score', 0)
                 else:
                     relevance_score = score_result
-                
-                print(f"User {user_id}: Job scored {relevance_score}/100")
-                
+
+                log.info("User %s: Job scored %s/100", user_id, relevance_score)
+
                 if relevance_score < settings.get('min_relevance_score', 60):
-                    print(f"User {user_id}: Job score too low ({relevance_score})")
+                    log.info("User %s: Job score too low (%s)", user_id, relevance_score)
                     jobs_skipped += 1
-                    continue
-                
-                # Find company domain and email
-                company_domain, hr_email = find_company_domain_and_email(
-                    job_data.get('company', ''), 
+                    return
+
+                # The Hunter lookup and the cover letter don't depend on
+                # each other, so overlap them: kick off the (blocking)
+                # email finder on the pool, then either reuse the
+                # speculative letter or generate one while Hunter runs
+                hunter_future = loop.run_in_executor(
+                    executor,
+                    find_company_domain_and_email,
+                    job_data.get('company', ''),
                     settings['hunter_api_key'],
                     settings.get('google_api_key')
                 )
-                
+
+                if speculative_letter is not None:
+                    cover_letter = speculative_letter
+                    company_domain, hr_email = await hunter_future
+                else:
+                    # Create scoring data from the AI score result
+                    scoring_data = {
+                        'score': relevance_score,
+                        'reasoning': 'AI-generated cover letter',
+                        'key_matches': [],
+                        'missing_skills': []
+                    }
+
+                    async def _letter_now():
+                        async with semaphore:
+                            return await generate_cover_letter(
+                                job_data,
+                                resume_text,
+                                scoring_data,
+                                settings['google_api_key'],
+                                resume_url,
+                                settings.get('custom_cover_letter_prompt'),
+                                bool(settings.get('attach_resume', 1))
+                            )
+
+                    (company_domain, hr_email), cover_letter = await asyncio.gather(
+                        hunter_future, _letter_now()
+                    )
+
                 if not hr_email:
-                    print(f"User {user_id}: No HR email found for {job_data.get('company', '')}")
+                    log.info("User %s: No HR email found for %s",
+                             user_id, job_data.get('company', ''))
                     jobs_skipped += 1
-                    continue
-                
-                # Generate cover letter
-                # Create scoring data from the AI score result
-                scoring_data = {
-                    'score': relevance_score,
-                    'reasoning': 'AI-generated cover letter',
-                    'key_matches': [],
-                    'missing_skills': []
-                }
-                
-                # Create resume URL - use a more reliable approach
-                resume_url = f"Resume attached as PDF file"
-                
-                cover_letter = generate_cover_letter(
-                    job_data, 
-                    resume_text, 
-                    scoring_data,
-                    settings['google_api_key'],
-                    resume_url,
-                    settings.get('custom_cover_letter_prompt'),
-                    bool(settings.get('attach_resume', 1))
-                )
-                
-                # Send email
-                if send_application_email(
+                    return
+
+                # Build the email now; actual sends are flushed through the
+                # Gmail batch endpoint once the fan-out finishes
+                raw_message = await loop.run_in_executor(
+                    executor,
+                    build_application_email,
                     settings['sender_email'],
                     settings['sender_name'],
                     hr_email,
@@ -1035,74 +1691,84 @@ def run_automation_task(user_id, run_id):
                     job_data.get('company', ''),
                     cover_letter,
                     settings
-                ):
-                    print(f"User {user_id}: Application sent to {hr_email}")
-                    applications_sent += 1
-                    
-                    # Record application in database
-                    try:
-                        app_id = db.record_application(
-                            job_url=job_url,
-                            job_title=job_data.get('job_title', ''),
-                            company=job_data.get('company', ''),
-                            hr_email=hr_email,
-                            relevance_score=relevance_score,
-                            status='sent'
-                        )
-                        print(f"User {user_id}: Application recorded with ID {app_id}")
-                    except Exception as e:
-                        print(f"User {user_id}: Error recording application: {e}")
-                else:
-                    print(f"User {user_id}: Failed to send email to {hr_email}")
+                )
+                if raw_message is None:
+                    log.info("User %s: Failed to build email for %s", user_id, hr_email)
                     jobs_skipped += 1
-                
-                # Small delay between applications
-                time.sleep(2)
-                
+                    return
+
+                pending_sends.append({
+                    'raw': raw_message,
+                    'hr_email': hr_email,
+                    'application': {
+                        'job_url': job_url,
+                        'job_title': job_data.get('job_title', ''),
+                        'company': job_data.get('company', ''),
+                        'hr_email': hr_email,
+                        'relevance_score': relevance_score,
+                        'status': 'sent'
+                    }
+                })
+
             except Exception as e:
-                print(f"User {user_id}: Error processing job {job_url}: {str(e)}")
+                log.info("User %s: Error processing job %s: %s", user_id, job_url, e)
                 jobs_skipped += 1
-                continue
-        
-        # Check if automation was stopped
-        conn = get_user_db()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT stop_requested FROM job_runs WHERE id = ?",
-            (run_id,)
-        )
-        stop_requested = cursor.fetchone()
-        
-        if stop_requested and stop_requested[0]:
-            print(f"User {user_id}: Automation stopped by user - Processed: {jobs_processed}, Applied: {applications_sent}, Skipped: {jobs_skipped}")
+
+        try:
+            await asyncio.gather(*(process_job(job_data) for job_data in candidates))
+        finally:
+            executor.shutdown(wait=False)
+
+        # Flush buffered emails through the Gmail batch endpoint - one
+        # HTTPS round trip per 50 sends instead of one per message
+        if pending_sends:
+            service = get_gmail_service(settings)
+            sent_entries = flush_gmail_batch(service, pending_sends) if service else []
+            applications_sent += len(sent_entries)
+            for entry in sent_entries:
+                log.info("User %s: Application sent to %s", user_id, entry['hr_email'])
+                pending_applications.append(entry['application'])
+            jobs_skipped += len(pending_sends) - len(sent_entries)
+
+        # Flush buffered application records in a single transaction
+        # (one journal commit instead of one per job)
+        if pending_applications:
+            try:
+                app_ids = db.record_applications_batch(pending_applications)
+                log.info("User %s: Recorded %d applications", user_id, len(app_ids))
+            except Exception as e:
+                log.info("User %s: Error recording applications: %s", user_id, e)
+
+        # Check if automation was stopped (event/flag already tracked it,
+        # so no extra SELECT here) and write the final state in one UPDATE
+        if stop_requested_now():
+            log.info("User %s: Automation stopped by user - Processed: %d, Applied: %d, Skipped: %d",
+                     user_id, jobs_processed, applications_sent, jobs_skipped)
             status = 'stopped'
         else:
-            print(f"User {user_id}: Automation completed - Processed: {jobs_processed}, Applied: {applications_sent}, Skipped: {jobs_skipped}")
+            log.info("User %s: Automation completed - Processed: %d, Applied: %d, Skipped: %d",
+                     user_id, jobs_processed, applications_sent, jobs_skipped)
             status = 'completed'
-        
-        # Debug: Check what's in the user database
-        try:
-            stats = db.get_application_stats()
-            print(f"User {user_id}: Database stats after completion: {stats}")
-        except Exception as e:
-            print(f"User {user_id}: Error getting database stats: {e}")
-        
-        # Update run status
+
+        conn = get_user_db()
+        cursor = conn.cursor()
         cursor.execute("""
             UPDATE job_runs SET
                 status = ?,
                 jobs_processed = ?,
                 applications_sent = ?,
+                jobs_skipped = ?,
+                emails_sent = ?,
                 completed_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        """, (status, jobs_processed, applications_sent, run_id))
+        """, (status, jobs_processed, applications_sent, jobs_skipped,
+              applications_sent, run_id))
         conn.commit()
-        conn.close()
         
         db.close()
         
     except Exception as e:
-        print(f"User {user_id}: Automation failed: {str(e)}")
+        log.info("User %s: Automation failed: %s", user_id, e)
         
         # Update run status to failed
         conn = get_user_db()
@@ -1114,19 +1780,18 @@ def run_automation_task(user_id, run_id):
             WHERE id = ?
         """, (run_id,))
         conn.commit()
-        conn.close()
 
 
 @app.route('/applications')
 @login_required
 def applications():
     """View user's applications"""
-    user_db_path = os.path.join(DATABASE_DIR, f"user_{current_user.id}_jobs.db")
-    
-    if not os.path.exists(user_db_path):
+    db_path = user_db_path(current_user.id)
+
+    if not os.path.exists(db_path):
         return render_template('applications.html', applications=[])
-    
-    with JobDatabase(user_db_path) as db:
+
+    with JobDatabase(db_path) as db:
         apps = db.get_recent_applications(50)
     
     return render_template('applications.html', applications=apps)
@@ -2,6 +2,7 @@
 """SQLite database for tracking job applications"""
 import sqlite3
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
@@ -19,14 +20,65 @@ class JobDatabase:
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self._in_txn = False
         self._connect()
         self._create_tables()
+        # Known URLs loaded once so the per-candidate duplicate check is
+        # a hash lookup, not a SQLite round trip (the URL set is small -
+        # one row per job this user ever processed)
+        self.cursor.execute("SELECT job_url FROM jobs")
+        self._seen_urls = {row['job_url'] for row in self.cursor.fetchall()}
     
     def _connect(self):
         """Connect to database"""
-        self.conn = sqlite3.connect(self.db_path)
+        # A larger statement cache keeps the hot INSERT/SELECT statements
+        # compiled across calls instead of reparsing the SQL each time
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
         self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        # WAL lets readers run during a writer's commit and roughly halves
+        # commit latency; NORMAL sync is safe in WAL mode
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA busy_timeout=5000")
         self.cursor = self.conn.cursor()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writer calls into one commit
+
+        Usage:
+            with db.transaction():
+                job_id = db.add_job(...)
+                db.add_application(job_id, ...)
+
+        Writer methods commit themselves when called standalone, but
+        inside this block they defer to the single commit (or rollback
+        on exception) at block end. Nesting is a no-op.
+        """
+        if self._in_txn:
+            yield
+            return
+        self._in_txn = True
+        try:
+            with self.conn:
+                yield
+        except Exception:
+            # Rolled-back inserts may have optimistically landed in the
+            # URL cache; reload it from the table so it can't go stale
+            self.cursor.execute("SELECT job_url FROM jobs")
+            self._seen_urls = {row['job_url'] for row in self.cursor.fetchall()}
+            raise
+        finally:
+            self._in_txn = False
+
+    def _maybe_commit(self):
+        """Commit unless an enclosing transaction() owns the commit"""
+        if not self._in_txn:
+            self.conn.commit()
     
     def _create_tables(self):
         """Create database tables if they don't exist"""
@@ -97,7 +149,18 @@ class JobDatabase:
         self.cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_job_id ON jobs(job_id)
         """)
-        
+        # Covers the applied-check join so it resolves as an index probe
+        # instead of scanning a job's applications for the status match
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_app_job_status
+            ON applications(job_id, status)
+        """)
+        # Status-only filter used by the stats counts
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_app_status
+            ON applications(status)
+        """)
+
         self.conn.commit()
     
     def job_already_processed(self, job_url: str) -> bool:
@@ -110,12 +173,19 @@ class JobDatabase:
         Returns:
             True if job was already processed, False otherwise
         """
+        if job_url in self._seen_urls:
+            return True
+
+        # Fall through on a miss in case another writer added the row
+        # after our snapshot was loaded
         self.cursor.execute("""
-            SELECT COUNT(*) as count FROM jobs WHERE job_url = ?
+            SELECT 1 FROM jobs WHERE job_url = ? LIMIT 1
         """, (job_url,))
-        
-        result = self.cursor.fetchone()
-        return result['count'] > 0
+
+        if self.cursor.fetchone() is not None:
+            self._seen_urls.add(job_url)
+            return True
+        return False
     
     def job_already_applied(self, job_url: str) -> bool:
         """
@@ -128,49 +198,115 @@ class JobDatabase:
             True if already applied, False otherwise
         """
         self.cursor.execute("""
-            SELECT COUNT(*) as count 
+            SELECT 1
             FROM jobs j
             JOIN applications a ON j.id = a.job_id
             WHERE j.job_url = ? AND a.status = 'Applied'
+            LIMIT 1
         """, (job_url,))
-        
-        result = self.cursor.fetchone()
-        return result['count'] > 0
-    
+
+        return self.cursor.fetchone() is not None
+
+    def get_all_applied_urls(self) -> set:
+        """
+        Get every job URL that already has an application
+
+        Returns:
+            Set of job URLs with status 'Applied'
+        """
+        self.cursor.execute("""
+            SELECT j.job_url
+            FROM jobs j
+            JOIN applications a ON j.id = a.job_id
+            WHERE a.status = 'Applied'
+        """)
+        return {row['job_url'] for row in self.cursor.fetchall()}
+
     def add_job(self, job_data: Dict[str, Any]) -> int:
         """
         Add a job to the database
-        
+
         Args:
             job_data: Dictionary containing job information
-            
+
         Returns:
             Job ID (database primary key)
         """
-        self.cursor.execute("""
-            INSERT OR IGNORE INTO jobs 
-            (job_id, job_url, company, title, location, description, 
+        # One statement instead of INSERT-then-SELECT where RETURNING is
+        # available (SQLite 3.35+); also closes the window where another
+        # writer could slip in between the two statements
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            try:
+                row = self.cursor.execute("""
+                    INSERT INTO jobs
+                    (job_id, job_url, company, title, location, description,
+                     applicant_count, days_posted, salary_min, salary_max)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(job_url) DO UPDATE
+                        SET last_processed = CURRENT_TIMESTAMP
+                    RETURNING id
+                """, (
+                    job_data.get('JobID'),
+                    job_data.get('job_url'),
+                    job_data.get('Company'),
+                    job_data.get('Title'),
+                    job_data.get('Location'),
+                    job_data.get('Description'),
+                    job_data.get('applicant_count_num'),
+                    job_data.get('days_posted_ago'),
+                    job_data.get('salary_min'),
+                    job_data.get('salary_max')
+                )).fetchone()
+                self._maybe_commit()
+                self._seen_urls.add(job_data.get('job_url'))
+                return row['id']
+            except sqlite3.IntegrityError:
+                # e.g. duplicate job_id on a different URL - the bulk
+                # path's INSERT OR IGNORE handles that like before
+                pass
+
+        return self.add_jobs_bulk([job_data])[0]
+
+    def add_jobs_bulk(self, job_data_list: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add many jobs in a single transaction
+
+        One executemany + commit instead of a journal fsync per row.
+
+        Args:
+            job_data_list: List of job dictionaries (see add_job)
+
+        Returns:
+            List of job IDs, in input order
+        """
+        self.cursor.executemany("""
+            INSERT OR IGNORE INTO jobs
+            (job_id, job_url, company, title, location, description,
              applicant_count, days_posted, salary_min, salary_max)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            job_data.get('JobID'),
-            job_data.get('job_url'),
-            job_data.get('Company'),
-            job_data.get('Title'),
-            job_data.get('Location'),
-            job_data.get('Description'),
-            job_data.get('applicant_count_num'),
-            job_data.get('days_posted_ago'),
-            job_data.get('salary_min'),
-            job_data.get('salary_max')
-        ))
-        
-        self.conn.commit()
-        
-        # Get the job ID
-        self.cursor.execute("SELECT id FROM jobs WHERE job_url = ?", (job_data.get('job_url'),))
-        result = self.cursor.fetchone()
-        return result['id']
+        """, [(
+                job_data.get('JobID'),
+                job_data.get('job_url'),
+                job_data.get('Company'),
+                job_data.get('Title'),
+                job_data.get('Location'),
+                job_data.get('Description'),
+                job_data.get('applicant_count_num'),
+                job_data.get('days_posted_ago'),
+                job_data.get('salary_min'),
+                job_data.get('salary_max')
+            ) for job_data in job_data_list])
+        self._maybe_commit()
+
+        job_ids = []
+        for job_data in job_data_list:
+            self.cursor.execute(
+                "SELECT id FROM jobs WHERE job_url = ?",
+                (job_data.get('job_url'),)
+            )
+            job_ids.append(self.cursor.fetchone()['id'])
+            self._seen_urls.add(job_data.get('job_url'))
+        return job_ids
     
     def add_application(
         self,
@@ -205,41 +341,58 @@ class JobDatabase:
             ', '.join(scoring_data.get('missing_skills', [])),
             cover_letter
         ))
-        
-        self.conn.commit()
-        return self.cursor.lastrowid
+
+        row_id = self.cursor.lastrowid
+        self._maybe_commit()
+        return row_id
     
     def add_email_sent(self, application_id: int, recipient_email: str, success: bool = True):
         """
         Record an email that was sent
-        
+
         Args:
             application_id: Application ID from database
             recipient_email: Email address
             success: Whether email was sent successfully
         """
-        self.cursor.execute("""
+        self.add_emails_sent_bulk([(application_id, recipient_email, success)])
+
+    def add_emails_sent_bulk(self, rows: List[tuple]):
+        """
+        Record many sent emails in a single transaction
+
+        Args:
+            rows: List of (application_id, recipient_email, success) tuples
+        """
+        self.cursor.executemany("""
             INSERT INTO emails_sent (application_id, recipient_email, success)
             VALUES (?, ?, ?)
-        """, (application_id, recipient_email, success))
-        
-        self.conn.commit()
-    
+        """, rows)
+        self._maybe_commit()
+
     def add_skipped_job(self, job_id: int, skip_reason: str, skip_type: str):
         """
         Record a skipped job
-        
+
         Args:
             job_id: Job ID from database
             skip_reason: Reason for skipping
             skip_type: Type of skip (quality, score, no_emails, etc.)
         """
-        self.cursor.execute("""
+        self.add_skipped_jobs_bulk([(job_id, skip_reason, skip_type)])
+
+    def add_skipped_jobs_bulk(self, rows: List[tuple]):
+        """
+        Record many skipped jobs in a single transaction
+
+        Args:
+            rows: List of (job_id, skip_reason, skip_type) tuples
+        """
+        self.cursor.executemany("""
             INSERT INTO skipped_jobs (job_id, skip_reason, skip_type)
             VALUES (?, ?, ?)
-        """, (job_id, skip_reason, skip_type))
-        
-        self.conn.commit()
+        """, rows)
+        self._maybe_commit()
     
     def record_application(
         self,
@@ -303,6 +456,66 @@ class JobDatabase:
         
         return application_id
     
+    def record_applications_batch(self, applications: List[Dict[str, Any]]) -> List[int]:
+        """
+        Record multiple applications in a single transaction
+
+        Amortizes journal/fsync overhead versus one commit per job when
+        the automation run flushes its results.
+
+        Args:
+            applications: List of dicts with job_url, job_title, company,
+                          hr_email, relevance_score and optional status
+
+        Returns:
+            List of application IDs
+        """
+        application_ids = []
+
+        for app_data in applications:
+            self.cursor.execute("""
+                INSERT OR IGNORE INTO jobs
+                (job_url, company, title, location, description,
+                 applicant_count, days_posted, salary_min, salary_max)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                app_data.get('job_url'),
+                app_data.get('company'),
+                app_data.get('job_title'),
+                '', '', 0, 0, 0, 0
+            ))
+
+            self.cursor.execute(
+                "SELECT id FROM jobs WHERE job_url = ?",
+                (app_data.get('job_url'),)
+            )
+            job_id = self.cursor.fetchone()['id']
+
+            self.cursor.execute("""
+                INSERT INTO applications
+                (job_id, status, relevance_score, score_reasoning,
+                 key_matches, missing_skills, cover_letter)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                job_id,
+                app_data.get('status', 'sent'),
+                app_data.get('relevance_score', 0),
+                'AI-generated application',
+                '', '', ''
+            ))
+            application_id = self.cursor.lastrowid
+
+            self.cursor.execute("""
+                INSERT INTO emails_sent (application_id, recipient_email, success)
+                VALUES (?, ?, 1)
+            """, (application_id, app_data.get('hr_email')))
+
+            application_ids.append(application_id)
+            self._seen_urls.add(app_data.get('job_url'))
+
+        self._maybe_commit()
+        return application_ids
+
     def get_application_stats(self) -> Dict[str, int]:
         """
         Get statistics about applications
@@ -310,27 +523,17 @@ class JobDatabase:
         Returns:
             Dictionary with stats
         """
-        stats = {}
-        
-        # Total jobs processed
-        self.cursor.execute("SELECT COUNT(*) as count FROM jobs")
-        stats['total_jobs'] = self.cursor.fetchone()['count']
-        
-        # Applications sent
+        # One statement with scalar subqueries instead of four round trips
         self.cursor.execute("""
-            SELECT COUNT(*) as count FROM applications WHERE status = 'Applied'
+            SELECT
+                (SELECT COUNT(*) FROM jobs) AS total_jobs,
+                (SELECT COUNT(*) FROM applications WHERE status = 'Applied')
+                    AS applications_sent,
+                (SELECT COUNT(*) FROM skipped_jobs) AS jobs_skipped,
+                (SELECT COUNT(*) FROM emails_sent WHERE success = 1)
+                    AS emails_sent
         """)
-        stats['applications_sent'] = self.cursor.fetchone()['count']
-        
-        # Jobs skipped
-        self.cursor.execute("SELECT COUNT(*) as count FROM skipped_jobs")
-        stats['jobs_skipped'] = self.cursor.fetchone()['count']
-        
-        # Emails sent
-        self.cursor.execute("SELECT COUNT(*) as count FROM emails_sent WHERE success = 1")
-        stats['emails_sent'] = self.cursor.fetchone()['count']
-        
-        return stats
+        return dict(self.cursor.fetchone())
     
     def get_recent_applications(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
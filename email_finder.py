@@ -1,9 +1,141 @@
 # email_finder.py
 """Find HR emails using Hunter.io API"""
-import time
+import concurrent.futures
+import functools
+import re
+import socket
 import requests
+from html.parser import HTMLParser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional
 
+# Shared session: keep-alive amortizes the TCP+TLS handshake across the
+# many Hunter.io and contact-page requests one run makes, and urllib3's
+# Retry handles 429/5xx with backoff and Retry-After compliance so the
+# callers don't need hand-rolled retry loops
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Compiled once - scrape_contact_emails runs this over every fetched page
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Bytes-level variant: email addresses are 7-bit ASCII by RFC, so raw
+# page bytes can be scanned without decoding the payload first
+_EMAIL_BYTES_RE = re.compile(rb'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+
+# Contact pages carry their emails near the top; don't download multi-MB
+# of marketing JS past this point
+MAX_PAGE_BYTES = 512 * 1024
+
+
+def _fetch_page(url: str, headers: Dict[str, str]):
+    """
+    Fetch up to MAX_PAGE_BYTES of a page
+
+    Args:
+        url: Page URL
+        headers: Request headers
+
+    Returns:
+        (raw bytes, declared encoding) tuple, or None on a non-200
+    """
+    response = _SESSION.get(url, headers=headers, timeout=10, stream=True)
+    try:
+        if response.status_code != 200:
+            return None
+        content = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+    finally:
+        response.close()
+    return content, response.encoding
+
+# Company-name cleanup for domain guessing: drop legal suffixes as whole
+# words, then remap/remove punctuation in one translate pass
+_LEGAL_SUFFIX_RE = re.compile(r'\b(?:inc|llc|corp|ltd|limited)\b\.?')
+_DOMAIN_TRANS = str.maketrans({' ': '', '&': 'and', '+': 'plus',
+                               '.': '', ',': ''})
+
+# Optional dependency - lexbor is a C HTML parser roughly an order of
+# magnitude faster than pure-Python parsing; the stdlib HTMLParser
+# subclass below covers installs without it
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+class _MailtoExtractor(HTMLParser):
+    """Minimal stdlib parser collecting page text and mailto hrefs
+
+    All the contact scrape needs is text content plus <a href="mailto:">
+    targets, which this does without bs4's per-tag object allocation
+    (and without importing bs4 at all).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text_parts = []
+        self.mailto_hrefs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            for name, value in attrs:
+                if name == 'href' and value and 'mailto:' in value:
+                    self.mailto_hrefs.append(value)
+
+    def handle_data(self, data):
+        self.text_parts.append(data)
+
+
+def _extract_page_emails(html: str, domain: str) -> List[str]:
+    """
+    Pull same-domain emails out of one page (text + mailto links)
+
+    Args:
+        html: Page HTML
+        domain: Company domain to filter addresses against
+
+    Returns:
+        List of email addresses ending in @domain
+    """
+    suffix = f'@{domain}'
+    emails = []
+
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        text_content = tree.body.text(deep=True) if tree.body else ''
+        mailto_hrefs = [
+            node.attributes.get('href', '') or ''
+            for node in tree.css('a[href^="mailto:"]')
+        ]
+    else:
+        parser = _MailtoExtractor()
+        parser.feed(html)
+        text_content = ' '.join(parser.text_parts)
+        mailto_hrefs = parser.mailto_hrefs
+
+    emails.extend(
+        email for email in _EMAIL_RE.findall(text_content)
+        if email.endswith(suffix)
+    )
+
+    for href in mailto_hrefs:
+        email = href.replace('mailto:', '').split('?')[0]
+        if email.endswith(suffix):
+            emails.append(email)
+
+    return emails
+
 
 def find_hr_emails(
     domain: str,
@@ -18,8 +150,8 @@ def find_hr_emails(
         domain: Company domain (e.g., 'example.com')
         api_key: Hunter.io API key
         limit: Maximum number of emails to return
-        max_retries: Maximum retry attempts
-        
+        max_retries: Unused, kept for callers (the shared session retries)
+
     Returns:
         List of email addresses
     """
@@ -33,40 +165,69 @@ def find_hr_emails(
         "limit": limit,
         "department": "hr"
     }
-    
-    # Retry logic for rate limits and transient errors
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, params=params, timeout=20)
-            
-            # Handle rate limiting
-            if response.status_code in (429, 500, 502, 503, 504):
-                wait_time = 1.5 * (attempt + 1)
-                print(f"Rate limited or server error, waiting {wait_time}s...")
-                time.sleep(wait_time)
-                continue
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract emails from response
-            emails = []
-            email_data = data.get('data', {}).get('emails', [])
-            
-            for entry in email_data:
-                email = entry.get('value')
-                if email:
-                    emails.append(email)
-            
+
+    # Rate limits and transient errors are retried by the session's
+    # urllib3 Retry policy
+    try:
+        response = _SESSION.get(url, params=params, timeout=20)
+        response.raise_for_status()
+        data = response.json()
+    except requests.exceptions.RequestException as e:
+        print(f"Error finding emails: {e}")
+        return []
+
+    # Extract emails from response
+    emails = []
+    email_data = data.get('data', {}).get('emails', [])
+
+    for entry in email_data:
+        email = entry.get('value')
+        if email:
+            emails.append(email)
+
+    return emails
+
+
+def _probe_domain(domain: str, api_key: str) -> List[str]:
+    """
+    Run one domain through the fallback chain
+
+    Hunter.io search, then verified generic patterns, then contact-page
+    scraping - first non-empty result wins.
+
+    Args:
+        domain: Candidate domain
+        api_key: Hunter.io API key
+
+    Returns:
+        List of email addresses (empty when everything came up dry)
+    """
+    print(f"  Trying domain: {domain}")
+
+    # Try Hunter.io with this domain
+    try:
+        emails = find_hr_emails(domain, api_key)
+        if emails:
+            print(f"  Found {len(emails)} emails with Hunter.io for {domain}")
             return emails
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Error finding emails (attempt {attempt + 1}/{max_retries}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(1.5 * (attempt + 1))
-            else:
-                return []
-    
+    except Exception:
+        pass
+
+    # Try generic email patterns, vetted against Hunter's verifier
+    # so guessed addresses that would bounce never get sent to
+    generic_emails = verify_deliverable_emails(
+        generate_generic_emails(domain), api_key
+    )
+    if generic_emails:
+        print(f"  Verified {len(generic_emails)} generic email patterns for {domain}")
+        return generic_emails
+
+    # Try web scraping
+    scraped_emails = scrape_contact_emails(domain)
+    if scraped_emails:
+        print(f"  Scraped {len(scraped_emails)} emails from {domain}")
+        return scraped_emails
+
     return []
 
 
@@ -84,7 +245,7 @@ def find_company_domain_and_emails(
         company_name: Company name
         api_key: Hunter.io API key
         limit: Maximum number of emails to return
-        max_retries: Maximum retry attempts
+        max_retries: Unused, kept for callers (the shared session retries)
         google_api_key: Google API key for AI generation (optional)
         
     Returns:
@@ -104,68 +265,55 @@ def find_company_domain_and_emails(
         "department": "hr"
     }
     
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, params=params, timeout=20)
-            
-            # Handle rate limiting
-            if response.status_code in (429, 500, 502, 503, 504):
-                wait_time = 1.5 * (attempt + 1)
-                print(f"  Rate limited or server error, waiting {wait_time}s...")
-                time.sleep(wait_time)
-                continue
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract domain and emails
-            domain = data.get('data', {}).get('domain', '')
-            emails = []
-            email_data = data.get('data', {}).get('emails', [])
-            
-            for entry in email_data:
-                email = entry.get('value')
-                if email:
-                    emails.append(email)
-            
-            if domain and emails:
-                print(f"  Hunter.io found {len(emails)} emails for domain: {domain}")
-                return {'domain': domain, 'emails': emails}
-            
-        except requests.exceptions.RequestException as e:
-            print(f"  Error searching company (attempt {attempt + 1}/{max_retries}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(1.5 * (attempt + 1))
+    try:
+        response = _SESSION.get(url, params=params, timeout=20)
+        response.raise_for_status()
+        data = response.json()
+
+        # Extract domain and emails
+        domain = data.get('data', {}).get('domain', '')
+        emails = []
+        email_data = data.get('data', {}).get('emails', [])
+
+        for entry in email_data:
+            email = entry.get('value')
+            if email:
+                emails.append(email)
+
+        if domain and emails:
+            print(f"  Hunter.io found {len(emails)} emails for domain: {domain}")
+            return {'domain': domain, 'emails': emails}
+
+    except requests.exceptions.RequestException as e:
+        print(f"  Error searching company: {e}")
     
     # Strategy 2: Try comprehensive fallback methods
     print(f"  Hunter.io failed, trying fallback methods...")
     
-    # Generate domain variations and try each one
-    domain_variations = generate_domain_variations(company_name)
-    
-    for domain in domain_variations:
-        print(f"  Trying domain: {domain}")
-        
-        # Try Hunter.io with this domain
-        try:
-            emails = find_hr_emails(domain, api_key)
-            if emails:
-                print(f"  Found {len(emails)} emails with Hunter.io for {domain}")
-                return {'domain': domain, 'emails': emails}
-        except:
-            pass
-        
-        # Try generic email patterns
-        generic_emails = generate_generic_emails(domain)
-        if generic_emails:
-            print(f"  Generated {len(generic_emails)} generic email patterns for {domain}")
-            return {'domain': domain, 'emails': generic_emails}
-        
-        # Try web scraping
-        scraped_emails = scrape_contact_emails(domain)
-        if scraped_emails:
-            print(f"  Scraped {len(scraped_emails)} emails from {domain}")
-            return {'domain': domain, 'emails': scraped_emails}
+    # Generate domain variations, then drop the ones that don't even
+    # resolve before spending Hunter.io calls on them
+    domain_variations = _resolvable_domains(
+        generate_domain_variations(company_name)
+    )
+
+    # The surviving variations are independent, so probe them in
+    # parallel and take the first domain that yields anything - wall
+    # time is bounded by one domain's workflow, not the sum of them
+    if domain_variations:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as ex:
+            futures = {
+                ex.submit(_probe_domain, domain, api_key): domain
+                for domain in domain_variations
+            }
+            for future in concurrent.futures.as_completed(futures):
+                domain = futures[future]
+                try:
+                    emails = future.result()
+                except Exception:
+                    continue
+                if emails:
+                    ex.shutdown(wait=False, cancel_futures=True)
+                    return {'domain': domain, 'emails': emails}
     
     # Strategy 3: Try AI generation if API key provided
     if google_api_key and domain_variations:
@@ -212,10 +360,12 @@ def find_emails_with_fallback(
             if emails:
                 break
     
-    # Strategy 3: Try generic email patterns
+    # Strategy 3: Try generic email patterns (verified before use)
     if not emails and domain and domain != 'UNKNOWN':
         print(f"Trying generic email patterns for domain: {domain}")
-        emails = generate_generic_emails(domain)
+        emails = verify_deliverable_emails(
+            generate_generic_emails(domain), api_key
+        )
     
     # Strategy 4: Try web scraping for contact information
     if not emails and domain and domain != 'UNKNOWN':
@@ -225,6 +375,36 @@ def find_emails_with_fallback(
     return emails
 
 
+def _resolvable_domains(domains: List[str]) -> List[str]:
+    """
+    Filter a domain list down to ones that resolve in DNS
+
+    A getaddrinfo call costs ~30ms cold (0ms cached) versus 1-2s of
+    billable Hunter.io time per dead guess, and the lookups run in
+    parallel so the whole batch takes the latency of the slowest one.
+
+    Args:
+        domains: Candidate domain names
+
+    Returns:
+        The subset that resolves, in input order
+    """
+    def resolves(domain):
+        try:
+            socket.getaddrinfo(domain, None)
+            return True
+        except socket.gaierror:
+            return False
+        except Exception:
+            # DNS infrastructure hiccup - don't drop the candidate
+            return True
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
+        results = list(ex.map(resolves, domains))
+
+    return [domain for domain, ok in zip(domains, results) if ok]
+
+
 def generate_domain_variations(company_name: str) -> List[str]:
     """
     Generate common domain variations for a company name
@@ -235,50 +415,32 @@ def generate_domain_variations(company_name: str) -> List[str]:
     Returns:
         List of potential domain names
     """
-    # Clean company name
-    clean_name = company_name.lower().strip()
-    clean_name = clean_name.replace(' ', '')
-    clean_name = clean_name.replace('&', 'and')
-    clean_name = clean_name.replace('+', 'plus')
-    clean_name = clean_name.replace('.', '')
-    clean_name = clean_name.replace(',', '')
-    clean_name = clean_name.replace('inc', '')
-    clean_name = clean_name.replace('llc', '')
-    clean_name = clean_name.replace('corp', '')
-    clean_name = clean_name.replace('ltd', '')
-    clean_name = clean_name.replace('limited', '')
-    
-    variations = []
-    
-    # Basic variations
-    variations.extend([
-        f"{clean_name}.com",
-        f"{clean_name}.org",
-        f"{clean_name}.net",
-        f"{clean_name}.co",
-        f"{clean_name}.io",
-        f"{clean_name}.ai",
-        f"{clean_name}.tech"
-    ])
-    
-    # Add spaces back for some variations
-    spaced_name = company_name.lower().replace(' ', '')
+    # Clean company name: strip legal suffixes on word boundaries (so
+    # 'Incline Inc' doesn't lose its 'inc' prefix), then map/remove the
+    # punctuation in a single translate pass
+    name = company_name.lower().strip()
+    clean_name = _LEGAL_SUFFIX_RE.sub('', name).strip().translate(_DOMAIN_TRANS)
+
+    # dict keys dedupe while preserving order, so identical variants
+    # (e.g. single-word names where spaced == hyphenated == clean)
+    # don't turn into duplicate Hunter.io probes downstream
+    variations = dict.fromkeys(
+        f"{clean_name}{tld}"
+        for tld in ('.com', '.org', '.net', '.co', '.io', '.ai', '.tech')
+    )
+
+    # Variant keeping legal suffixes/punctuation, spaces removed
+    spaced_name = name.replace(' ', '')
     if spaced_name != clean_name:
-        variations.extend([
-            f"{spaced_name}.com",
-            f"{spaced_name}.org",
-            f"{spaced_name}.net"
-        ])
-    
+        for tld in ('.com', '.org', '.net'):
+            variations.setdefault(f"{spaced_name}{tld}")
+
     # Try with hyphens
-    hyphen_name = company_name.lower().replace(' ', '-')
-    variations.extend([
-        f"{hyphen_name}.com",
-        f"{hyphen_name}.org",
-        f"{hyphen_name}.net"
-    ])
-    
-    return variations[:10]  # Limit to first 10 variations
+    hyphen_name = name.replace(' ', '-')
+    for tld in ('.com', '.org', '.net'):
+        variations.setdefault(f"{hyphen_name}{tld}")
+
+    return list(variations)[:10]  # Limit to first 10 variations
 
 
 def generate_generic_emails(domain: str) -> List[str]:
@@ -309,6 +471,45 @@ def generate_generic_emails(domain: str) -> List[str]:
     return generic_patterns
 
 
+def verify_deliverable_emails(emails: List[str], api_key: str) -> List[str]:
+    """
+    Filter candidate emails through Hunter's email-verifier
+
+    Guessed patterns that bounce waste SMTP sends and hurt sender
+    reputation; one verification credit per address is cheaper than
+    that. Verifications run in parallel on the shared session.
+
+    Args:
+        emails: Candidate email addresses
+        api_key: Hunter.io API key
+
+    Returns:
+        The deliverable subset, or the original list when the verifier
+        is unreachable (fail open rather than dropping every candidate)
+    """
+    def check(email):
+        try:
+            response = _SESSION.get(
+                "https://api.hunter.io/v2/email-verifier",
+                params={"api_key": api_key, "email": email},
+                timeout=20
+            )
+            response.raise_for_status()
+            data = response.json().get('data', {})
+            return data.get('status') == 'valid' or \
+                data.get('result') == 'deliverable'
+        except requests.exceptions.RequestException:
+            return None  # verifier unreachable, not a verdict
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(check, emails))
+
+    if all(result is None for result in results):
+        return emails
+
+    return [email for email, ok in zip(emails, results) if ok]
+
+
 def scrape_contact_emails(domain: str) -> List[str]:
     """
     Scrape contact emails from company website
@@ -319,12 +520,9 @@ def scrape_contact_emails(domain: str) -> List[str]:
     Returns:
         List of found email addresses
     """
-    import re
-    import requests
-    from bs4 import BeautifulSoup
-    
-    emails = []
-    
+    # Collected as a set so duplicates never need a separate dedup pass
+    emails = set()
+
     # Common contact page URLs to try
     contact_urls = [
         f"https://{domain}/contact",
@@ -340,64 +538,84 @@ def scrape_contact_emails(domain: str) -> List[str]:
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
-    
-    # Email regex pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    
-    for url in contact_urls:
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Find all text content
-                text_content = soup.get_text()
-                
-                # Extract emails using regex
-                found_emails = re.findall(email_pattern, text_content)
-                
-                # Filter for emails from the same domain
-                domain_emails = [email for email in found_emails if email.endswith(f'@{domain}')]
-                emails.extend(domain_emails)
-                
-                # Also look in href attributes
-                links = soup.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '')
-                    if 'mailto:' in href:
-                        email = href.replace('mailto:', '').split('?')[0]
-                        if email.endswith(f'@{domain}'):
-                            emails.append(email)
-                
+
+    # The pages are independent GETs, so fetch them in parallel (they
+    # share the keep-alive session) and stop at the first page that
+    # yields emails - wall time is bounded by the fastest hit instead of
+    # the sum of eight sequential timeouts
+    needle = f'@{domain}'.encode('ascii')
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+        futures = {
+            ex.submit(_fetch_page, url, headers): url
+            for url in contact_urls
+        }
+        for future in concurrent.futures.as_completed(futures):
+            url = futures[future]
+            try:
+                result = future.result()
+                if result is None:
+                    continue
+                content, encoding = result
+
+                # Fast path: scan the raw bytes - this catches addresses
+                # in page text and in mailto hrefs without a decode or a
+                # parse. Only when nothing matches do we decode and run
+                # the full parser (which also resolves &#64;-style
+                # entity obfuscation).
+                found = {
+                    match.group().decode('ascii')
+                    for match in _EMAIL_BYTES_RE.finditer(content)
+                    if match.group().endswith(needle)
+                }
+                if found:
+                    emails.update(found)
+                else:
+                    html = content.decode(encoding or 'utf-8',
+                                          errors='replace')
+                    emails.update(_extract_page_emails(html, domain))
+
                 if emails:
                     print(f"  Found {len(emails)} emails from {url}")
+                    ex.shutdown(wait=False, cancel_futures=True)
                     break
-                    
-        except Exception as e:
-            print(f"  Error scraping {url}: {e}")
-            continue
-    
-    # Remove duplicates and return
-    return list(set(emails))
+
+            except Exception as e:
+                print(f"  Error scraping {url}: {e}")
+                continue
+
+    return list(emails)
 
 
 def find_emails_with_ai_generation(company_name: str, domain: str, google_api_key: str) -> List[str]:
     """
     Use AI to generate likely email patterns for a company
-    
+
     Args:
         company_name: Company name
         domain: Company domain
         google_api_key: Google API key for Gemini
-        
+
     Returns:
         List of generated email addresses
     """
+    return list(_ai_emails_cached(company_name, domain, google_api_key))
+
+
+@functools.lru_cache(maxsize=1)
+def _gemini_model(google_api_key: str):
+    """One configured GenerativeModel per process - configure() plus
+    model construction aren't free and the key never changes mid-run"""
+    import google.generativeai as genai
+    genai.configure(api_key=google_api_key)
+    return genai.GenerativeModel('gemini-2.5-flash')
+
+
+@functools.lru_cache(maxsize=1024)
+def _ai_emails_cached(company_name: str, domain: str, google_api_key: str) -> tuple:
+    """Memoized Gemini email generation - the prompt is deterministic in
+    (company, domain), so repeat companies shouldn't pay another call"""
     try:
-        import google.generativeai as genai
-        
-        genai.configure(api_key=google_api_key)
-        
         prompt = f"""Based on the company "{company_name}" with domain "{domain}", generate the most likely HR/recruiting email addresses.
 
 Company: {company_name}
@@ -421,20 +639,20 @@ Examples of what to look for:
 - talent@domain.com
 - hiring@domain.com"""
 
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-        
-        # Parse the response
-        generated_emails = []
-        for line in response.text.strip().split('\n'):
-            line = line.strip()
-            if '@' in line and line.endswith(f'@{domain}'):
-                generated_emails.append(line)
-        
+        response = _gemini_model(google_api_key).generate_content(prompt)
+
+        # One pass over the response: a whole-line match keeps only bare
+        # same-domain addresses (and rejects trailing punctuation that
+        # the old strip/endswith loop let through)
+        line_re = re.compile(
+            rf'(?m)^\s*([A-Za-z0-9._%+\-]+@{re.escape(domain)})\s*$'
+        )
+        generated_emails = line_re.findall(response.text)
+
         print(f"  AI generated {len(generated_emails)} email patterns")
-        return generated_emails
-        
+        return tuple(generated_emails)
+
     except Exception as e:
         print(f"  Error generating emails with AI: {e}")
-        return []
+        return ()
 
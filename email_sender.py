@@ -2,10 +2,29 @@
 """Send emails via Gmail API"""
 import base64
 import email.message
+import functools
+import time
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from typing import List, Dict
 
+# Gmail's documented cap on requests per batch call
+GMAIL_BATCH_LIMIT = 100
+
+
+@functools.lru_cache(maxsize=2)
+def _gmail_service(token_path: str):
+    """Authorized Gmail service, built once per token path
+
+    Re-reading token.json, re-parsing credentials and re-running the
+    discovery setup per send adds up in bulk runs; the credentials
+    object refreshes itself when the access token expires, so one
+    service instance per process is safe. cache_discovery=False skips
+    the deprecated file-cache lookup.
+    """
+    creds = Credentials.from_authorized_user_file(token_path)
+    return build('gmail', 'v1', credentials=creds, cache_discovery=False)
+
 
 def send_application_email(
     to_email: str,
@@ -30,9 +49,8 @@ def send_application_email(
         True if sent successfully, False otherwise
     """
     try:
-        creds = Credentials.from_authorized_user_file(token_path)
-        service = build('gmail', 'v1', credentials=creds)
-        
+        service = _gmail_service(token_path)
+
         # Create message
         msg = email.message.EmailMessage()
         msg['To'] = to_email
@@ -81,18 +99,62 @@ def send_to_multiple_recipients(
     Returns:
         Dictionary mapping email addresses to success status
     """
-    results = {}
-    
-    for recipient in recipients:
-        success = send_application_email(
-            to_email=recipient,
-            subject=subject,
-            body_html=body_html,
-            sender_name=sender_name,
-            sender_email=sender_email,
-            token_path=token_path
-        )
-        results[recipient] = success
-    
+    results = {recipient: False for recipient in recipients}
+
+    try:
+        service = _gmail_service(token_path)
+    except Exception as e:
+        print(f"✗ Error building Gmail service: {e}")
+        return results
+
+    # Only the To: header differs between recipients, so serialize the
+    # message once and splice each recipient's To: line onto the shared
+    # template bytes - no per-recipient EmailMessage rebuild and no
+    # re-serialization of the HTML body
+    msg = email.message.EmailMessage()
+    msg['From'] = f"{sender_name} <{sender_email}>"
+    msg['Subject'] = subject
+    msg.set_content(body_html, subtype='html')
+    template_bytes = msg.as_bytes()
+    linesep = msg.policy.linesep.encode('ascii')
+
+    id_to_email = {}
+
+    def record(request_id, response, exception):
+        recipient = id_to_email[request_id]
+        if exception is None:
+            results[recipient] = True
+            print(f"✓ Email sent to {recipient}")
+        else:
+            print(f"✗ Error sending email to {recipient}: {exception}")
+
+    # One HTTPS round trip per batch of up to 100 sends instead of a
+    # full credential/service/request cycle per recipient
+    for start in range(0, len(recipients), GMAIL_BATCH_LIMIT):
+        chunk = recipients[start:start + GMAIL_BATCH_LIMIT]
+        batch = service.new_batch_http_request(callback=record)
+
+        for i, recipient in enumerate(chunk):
+            raw = b'To: ' + recipient.encode('ascii') + linesep + template_bytes
+            encoded_msg = base64.urlsafe_b64encode(raw).decode()
+            request_id = str(start + i)
+            id_to_email[request_id] = recipient
+            batch.add(
+                service.users().messages().send(
+                    userId='me',
+                    body={'raw': encoded_msg}
+                ),
+                request_id=request_id
+            )
+
+        try:
+            batch.execute()
+        except Exception as e:
+            print(f"✗ Error executing Gmail batch: {e}")
+
+        # Breathe between batches to stay under Gmail's per-user quota
+        if start + GMAIL_BATCH_LIMIT < len(recipients):
+            time.sleep(0.2)
+
     return results
 
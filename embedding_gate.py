@@ -0,0 +1,134 @@
+# embedding_gate.py
+"""Cheap vector pre-filter before Gemini scoring
+
+Embeds the resume and job text with a small local sentence-transformers
+model and lets callers skip the slow, paid Gemini call when the cosine
+similarity is clearly below the relevance bar.
+"""
+import hashlib
+import os
+import pickle
+from typing import List, Optional
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+DEFAULT_THRESHOLD = 0.55
+
+# Optional dependency, resolved on first use rather than at import time:
+# sentence_transformers pulls in torch, which alone adds seconds to
+# process start, and web workers that never run automation shouldn't
+# pay that on every boot/reload.
+_st_cls = None
+_st_missing = False
+
+_model = None
+_resume_emb_cache = {}
+
+
+def _sentence_transformer_cls():
+    """Import SentenceTransformer lazily; None when not installed"""
+    global _st_cls, _st_missing
+    if _st_cls is None and not _st_missing:
+        try:
+            from sentence_transformers import SentenceTransformer
+            _st_cls = SentenceTransformer
+        except ImportError:
+            _st_missing = True
+    return _st_cls
+
+
+def gate_available() -> bool:
+    """Check whether the embedding gate can run"""
+    return _sentence_transformer_cls() is not None
+
+
+def _get_model():
+    """Lazy-load the embedding model once per process"""
+    global _model
+    if _model is None:
+        cls = _sentence_transformer_cls()
+        if cls is not None:
+            _model = cls(MODEL_NAME)
+    return _model
+
+
+def embed_texts(texts: List[str], batch_size: int = 32):
+    """
+    Embed a batch of texts with normalized embeddings
+
+    Args:
+        texts: List of texts to embed
+        batch_size: Batch size for the encoder
+
+    Returns:
+        Embedding matrix, or None if the gate is unavailable
+    """
+    model = _get_model()
+    if model is None:
+        return None
+    return model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
+
+
+def get_resume_embedding(resume_text: str, cache_path: Optional[str] = None):
+    """
+    Get the resume embedding, using in-memory and optional disk caches
+
+    Args:
+        resume_text: Candidate's resume text
+        cache_path: Optional path to a pickled on-disk cache
+                    (e.g. uploads/user_1_resume.emb)
+
+    Returns:
+        Normalized resume embedding, or None if the gate is unavailable
+    """
+    key = hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+
+    if key in _resume_emb_cache:
+        return _resume_emb_cache[key]
+
+    # Try the on-disk cache (keyed by resume hash so stale entries miss)
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, emb = pickle.load(f)
+            if cached_key == key:
+                _resume_emb_cache[key] = emb
+                return emb
+        except Exception as e:
+            print(f"Error loading resume embedding cache: {e}")
+
+    model = _get_model()
+    if model is None:
+        return None
+
+    emb = model.encode(resume_text, normalize_embeddings=True)
+    _resume_emb_cache[key] = emb
+
+    if cache_path:
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump((key, emb), f)
+        except Exception as e:
+            print(f"Error saving resume embedding cache: {e}")
+
+    return emb
+
+
+def similarity(resume_text: str, job_text: str, cache_path: Optional[str] = None) -> Optional[float]:
+    """
+    Cosine similarity between resume and job text
+
+    Args:
+        resume_text: Candidate's resume text
+        job_text: Job title + description
+        cache_path: Optional resume embedding cache path
+
+    Returns:
+        Cosine similarity in [-1, 1], or None if the gate is unavailable
+    """
+    resume_emb = get_resume_embedding(resume_text, cache_path)
+    if resume_emb is None:
+        return None
+
+    model = _get_model()
+    job_emb = model.encode(job_text, normalize_embeddings=True)
+    return float(job_emb @ resume_emb)
@@ -1,11 +1,142 @@
 # job_scraper.py
 """LinkedIn job scraping and parsing"""
+import concurrent.futures
+import functools
+import json
+import logging
+import pathlib
 import re
 import time
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, NamedTuple, Optional
 from linkedin import parse_job_html
+from rate_limiter import LINKEDIN_LIMITER
+
+# Module logger: scrape diagnostics go out at DEBUG so bulk runs can
+# silence them, and log records don't interleave mid-line the way
+# prints do once detail fetches run concurrently
+log = logging.getLogger(__name__)
+
+# Optional dependency - orjson's C parser is ~3x faster than stdlib
+# json on the JSON-LD blobs the fallback extractors decode
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Hot-path patterns compiled once - normalize_job_data runs these on
+# every scraped job record
+_DIGITS = re.compile(r'\d+')
+_SALARY_NUM = re.compile(r'\d{1,3}(?:,\d{3})*(?:\.\d+)?')
+
+# Parsed job details are cached on disk keyed by job id, so re-runs
+# within the TTL skip both the download and the BeautifulSoup parse -
+# the two dominant costs of a detail scrape
+_JOB_CACHE_DIR = pathlib.Path('.job_cache')
+_JOB_CACHE_TTL = 86400  # seconds
+_JOB_ID_RE = re.compile(r'/jobs/view/(?:[^/]*-)?(\d+)')
+
+# Fallback extraction patterns, compiled once. These run over the raw
+# page string precisely so the fallbacks never pay for building a full
+# DOM just to reach a few <script> blobs
+_JSON_LD_SCRIPT_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL
+)
+_SCRIPT_RE = re.compile(r'<script[^>]*>(.*?)</script>', re.DOTALL)
+_JOB_POSTING_OBJ_RE = re.compile(r'\{[^{}]*"jobPosting"[^{}]*\}')
+_JOB_VIEW_URL_RE = re.compile(r'https://www\.linkedin\.com/jobs/view/\d+')
+
+# Browser-like headers sent with every LinkedIn request
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+class _NullCookieJar(requests.cookies.RequestsCookieJar):
+    """Cookie jar that never stores anything
+
+    The session below is shared across every user's scrapes in a
+    worker, so cookies LinkedIn sets on one user's authenticated
+    responses (bcookie, JSESSIONID, refreshed li_at) must not be
+    replayed on anyone else's requests. Discarding at set_cookie time
+    keeps the jar empty without the races a clear-per-request approach
+    has under concurrent fetches; each request sends only the cookies
+    its caller passes in, which matches the one-session-per-call
+    behavior the pooled session replaced.
+    """
+
+    def set_cookie(self, cookie, *args, **kwargs):
+        pass
+
+
+# Shared session so scrapes reuse pooled TCP/TLS connections to
+# LinkedIn's edge instead of paying a fresh handshake per URL; urllib3's
+# Retry backs off on 429/5xx so callers don't need retry loops
+_SESSION = requests.Session()
+_SESSION.headers.update(REQUEST_HEADERS)
+_SESSION.cookies = _NullCookieJar()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503]
+    )
+))
+
+
+def _fetch(url: str, cookies: Dict[str, str]):
+    """Rate-limited GET through the shared session
+
+    Every LinkedIn request funnels through here, so the token bucket
+    caps the global request rate no matter how many workers fetch
+    concurrently; the adapter's Retry policy still backs off anything
+    that slips through.
+    """
+    LINKEDIN_LIMITER.acquire()
+    return _SESSION.get(url, cookies=cookies, timeout=30)
+
+
+class Job(NamedTuple):
+    """Immutable normalized view of a job posting for the AI pipeline
+
+    Defaults are applied once here so downstream prompt construction can
+    use plain attribute access instead of repeated dict.get lookups, and
+    the tuple is safe to share across threads/tasks.
+    """
+    title: str = 'N/A'
+    company: str = 'N/A'
+    location: str = 'N/A'
+    description: str = 'N/A'
+    url: str = ''
+
+    @classmethod
+    def from_dict(cls, job_data: Dict[str, Any]) -> 'Job':
+        """Build a Job from scraped or normalized dict data"""
+        def pick(*keys, default='N/A'):
+            for key in keys:
+                value = job_data.get(key)
+                if value:
+                    return value
+            return default
+
+        return cls(
+            title=pick('Title', 'title', 'job_title'),
+            company=pick('Company', 'company'),
+            location=pick('Location', 'location'),
+            description=pick('Description', 'description'),
+            url=pick('job_url', default='')
+        )
 
 
 def scrape_job_list(search_url: str, linkedin_cookie: str = None) -> List[str]:
@@ -19,106 +150,63 @@ def scrape_job_list(search_url: str, linkedin_cookie: str = None) -> List[str]:
     Returns:
         List of job URLs
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
-    
     cookies = {}
     if linkedin_cookie:
         cookies['li_at'] = linkedin_cookie
-        print(f"  Using authenticated LinkedIn session (cookie length: {len(linkedin_cookie)})")
+        log.debug("Using authenticated LinkedIn session (cookie length: %d)", len(linkedin_cookie))
     else:
-        print("  No LinkedIn cookie provided - using anonymous session")
-    
+        log.debug("No LinkedIn cookie provided - using anonymous session")
+
     try:
-        response = requests.get(search_url, headers=headers, cookies=cookies, timeout=30)
+        response = _fetch(search_url, cookies)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Extract job URLs from search results
-        job_links = []
+        soup = BeautifulSoup(response.text, 'lxml')
         
         # Debug: Check if we got a valid response
-        print(f"  Response status: {response.status_code}")
-        print(f"  Response length: {len(response.text)} characters")
-        print(f"  Final URL: {response.url}")
+        log.debug("Response status: %s", response.status_code)
+        log.debug("Response length: %d characters", len(response.text))
+        log.debug("Final URL: %s", response.url)
         
         # Check if we got redirected to login or blocked
         if 'login' in response.url.lower() or 'challenge' in response.url.lower():
-            print("  WARNING: Redirected to login/challenge page - LinkedIn cookie may be invalid")
+            log.warning("Redirected to login/challenge page - LinkedIn cookie may be invalid")
         elif response.status_code == 429:
-            print("  WARNING: Rate limited by LinkedIn")
+            log.warning("Rate limited by LinkedIn")
         elif len(response.text) < 1000:
-            print("  WARNING: Very short response - may be blocked or invalid")
+            log.warning("Very short response - may be blocked or invalid")
         
         # Check if this is a JavaScript-heavy page (authenticated session)
         if linkedin_cookie and len(response.text) > 1000000:  # Large response suggests JS app
-            print("  Detected JavaScript-heavy page (authenticated session) - trying different approach")
+            log.debug("Detected JavaScript-heavy page (authenticated session) - trying different approach")
             job_links = extract_jobs_from_js_app(response.text, search_url)
             if job_links:
-                print(f"  Found {len(job_links)} job URLs from JavaScript app")
+                log.info("Found %d job URLs from JavaScript app", len(job_links))
                 return job_links
         
-        # Try multiple selectors for job cards (LinkedIn changes their structure frequently)
-        selectors_to_try = [
-            'ul.jobs-search__results-list li div a[class*="base-card"]',  # Old selector
-            'ul.jobs-search__results-list li a[href*="/jobs/view/"]',     # More specific
-            'div[data-job-id] a[href*="/jobs/view/"]',                    # Alternative
-            'a[href*="/jobs/view/"]',                                     # Very broad
-            'ul.jobs-search__results-list li a',                         # Even broader
-            'div[class*="job-card"] a',                                   # Another variant
-            'div[class*="job"] a[href*="/jobs/"]'                        # Generic job links
-        ]
-        
-        for selector in selectors_to_try:
-            job_cards = soup.select(selector)
-            print(f"  Trying selector '{selector}': found {len(job_cards)} elements")
-            
-            if job_cards:
-                for card in job_cards:
-                    href = card.get('href')
-                    if href and '/jobs/view/' in href:
-                        # Clean up the URL
-                        if '?' in href:
-                            href = href.split('?')[0]
-                        if href not in job_links:  # Avoid duplicates
-                            job_links.append(href)
-                
-                if job_links:
-                    print(f"  Found {len(job_links)} job URLs with selector: {selector}")
-                    break
-        
-        # If still no results, try to find any links containing job IDs
-        if not job_links:
-            all_links = soup.find_all('a', href=True)
-            print(f"  Total links found on page: {len(all_links)}")
-            
-            for link in all_links:
-                href = link.get('href')
-                if href and '/jobs/view/' in href:
-                    if '?' in href:
-                        href = href.split('?')[0]
-                    if href not in job_links:
-                        job_links.append(href)
-            
-            print(f"  Found {len(job_links)} job URLs by scanning all links")
-        
+        # One anchor scan covers the whole old selector cascade: every
+        # job-card selector LinkedIn has used reduces to "an anchor whose
+        # href contains /jobs/view/", so a single find_all pass with an
+        # insertion-ordered dict dedup walks the tree once instead of up
+        # to eight times (and drops the quadratic not-in list check)
+        seen = {}
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if '/jobs/view/' in href:
+                seen.setdefault(href.split('?', 1)[0], None)
+        job_links = list(seen)
+        log.info("Found %d job URLs by scanning anchors", len(job_links))
+
         # If still no results, try to extract from JavaScript/JSON data
         if not job_links:
-            print("  Trying to extract job URLs from JavaScript/JSON data...")
+            log.debug("Trying to extract job URLs from JavaScript/JSON data...")
             job_links = extract_jobs_from_json_data(response.text)
-            print(f"  Found {len(job_links)} job URLs from JSON data")
+            log.info("Found %d job URLs from JSON data", len(job_links))
         
         return job_links
         
     except Exception as e:
-        print(f"Error scraping job list: {e}")
+        log.warning("Error scraping job list: %s", e)
         return []
 
 
@@ -133,11 +221,9 @@ def extract_jobs_from_js_app(html_content: str, search_url: str) -> List[str]:
     Returns:
         List of job URLs
     """
-    import re
-    import json
-    
-    job_links = []
-    
+    # Insertion-ordered dict: O(1) dedup across all three patterns
+    job_links = {}
+
     # Look for job data in various JavaScript patterns
     patterns_to_try = [
         # Pattern 1: Look for job IDs in data attributes
@@ -155,45 +241,36 @@ def extract_jobs_from_js_app(html_content: str, search_url: str) -> List[str]:
         matches = re.findall(pattern, html_content)
         for job_id in matches:
             if job_id.isdigit():
-                job_url = f"https://www.linkedin.com/jobs/view/{job_id}"
-                if job_url not in job_links:
-                    job_links.append(job_url)
-    
+                job_links.setdefault(f"https://www.linkedin.com/jobs/view/{job_id}", None)
+
     # Pattern 2: Look for JSON data in script tags
-    script_pattern = r'<script[^>]*>(.*?)</script>'
-    scripts = re.findall(script_pattern, html_content, re.DOTALL)
+    scripts = _SCRIPT_RE.findall(html_content)
     
     for script in scripts:
         # Look for job-related JSON data
         if 'jobPosting' in script or 'job' in script.lower():
             try:
                 # Try to find JSON objects
-                json_matches = re.findall(r'\{[^{}]*"jobPosting"[^{}]*\}', script)
+                json_matches = _JOB_POSTING_OBJ_RE.findall(script)
                 for json_str in json_matches:
                     try:
-                        data = json.loads(json_str)
+                        data = _json_loads(json_str)
                         if 'jobPosting' in data:
                             job_id = str(data['jobPosting'])
                             if job_id.isdigit():
-                                job_url = f"https://www.linkedin.com/jobs/view/{job_id}"
-                                if job_url not in job_links:
-                                    job_links.append(job_url)
+                                job_links.setdefault(f"https://www.linkedin.com/jobs/view/{job_id}", None)
                     except:
                         continue
             except:
                 continue
     
     # Pattern 3: Look for job URLs in the HTML content directly
-    url_pattern = r'https://www\.linkedin\.com/jobs/view/\d+'
-    url_matches = re.findall(url_pattern, html_content)
+    url_matches = _JOB_VIEW_URL_RE.findall(html_content)
     for url in url_matches:
-        if '?' in url:
-            url = url.split('?')[0]
-        if url not in job_links:
-            job_links.append(url)
-    
-    print(f"  Extracted {len(job_links)} job URLs from JavaScript app")
-    return job_links
+        job_links.setdefault(url.split('?', 1)[0], None)
+
+    log.debug("Extracted %d job URLs from JavaScript app", len(job_links))
+    return list(job_links)
 
 
 def extract_jobs_from_json_data(html_content: str) -> List[str]:
@@ -206,27 +283,21 @@ def extract_jobs_from_json_data(html_content: str) -> List[str]:
     Returns:
         List of job URLs
     """
-    import re
-    import json
-    
-    job_links = []
-    
+    # Insertion-ordered dict: O(1) dedup across both extraction passes
+    job_links = {}
+
     # Look for JSON-LD structured data
-    json_ld_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-    json_ld_scripts = re.findall(json_ld_pattern, html_content, re.DOTALL)
+    json_ld_scripts = _JSON_LD_SCRIPT_RE.findall(html_content)
     
     for script in json_ld_scripts:
         try:
-            data = json.loads(script)
+            data = _json_loads(script)
             if isinstance(data, dict) and 'itemListElement' in data:
                 for item in data['itemListElement']:
                     if 'url' in item:
                         url = item['url']
                         if '/jobs/view/' in url:
-                            if '?' in url:
-                                url = url.split('?')[0]
-                            if url not in job_links:
-                                job_links.append(url)
+                            job_links.setdefault(url.split('?', 1)[0], None)
         except:
             continue
     
@@ -241,47 +312,58 @@ def extract_jobs_from_json_data(html_content: str) -> List[str]:
         matches = re.findall(pattern, html_content)
         for url in matches:
             if '/jobs/view/' in url:
-                if '?' in url:
-                    url = url.split('?')[0]
-                if url not in job_links:
-                    job_links.append(url)
-    
-    return job_links
+                job_links.setdefault(url.split('?', 1)[0], None)
+
+    return list(job_links)
+
 
+def _job_cache_path(job_url: str) -> Optional[pathlib.Path]:
+    """Cache file for a job URL, or None when no job id is present"""
+    match = _JOB_ID_RE.search(job_url)
+    if not match:
+        return None
+    return _JOB_CACHE_DIR / f"{match.group(1)}.json"
 
-def scrape_job_details(job_url: str, linkedin_cookie: str = None) -> Dict[str, Any]:
+
+def scrape_job_details(
+    job_url: str,
+    linkedin_cookie: str = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
     """
     Scrape detailed information from a job posting
-    
+
     Args:
         job_url: URL of the job posting
         linkedin_cookie: Optional LinkedIn session cookie (li_at value)
-        
+        use_cache: Serve details cached within the last 24h; pass False
+                   to force a fresh scrape
+
     Returns:
         Dictionary containing job details
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
-    
+    cache_path = _job_cache_path(job_url) if use_cache else None
+    if cache_path and cache_path.exists():
+        try:
+            if time.time() - cache_path.stat().st_mtime < _JOB_CACHE_TTL:
+                with cache_path.open('r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            log.warning("Error reading job cache for %s: %s", job_url, e)
+
     cookies = {}
     if linkedin_cookie:
         cookies['li_at'] = linkedin_cookie
-    
+
     try:
-        response = requests.get(job_url, headers=headers, cookies=cookies, timeout=30)
+        response = _fetch(job_url, cookies)
         response.raise_for_status()
         
         # Use the existing parser
         job_data = parse_job_html(response.text)
         
         # Parse additional fields from the HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml')
         
         # Extract applicant count
         applicant_elem = soup.select_one('span.num-applicants__caption')
@@ -295,17 +377,55 @@ def scrape_job_details(job_url: str, linkedin_cookie: str = None) -> Dict[str, A
         job_data['applicant_text'] = applicant_text
         job_data['salary_text'] = salary_text
         job_data['job_url'] = job_url
-        
+
+        if cache_path:
+            try:
+                _JOB_CACHE_DIR.mkdir(exist_ok=True)
+                with cache_path.open('w', encoding='utf-8') as f:
+                    json.dump(job_data, f)
+            except Exception as e:
+                log.warning("Error writing job cache for %s: %s", job_url, e)
+
         return job_data
         
     except Exception as e:
-        print(f"Error scraping job details from {job_url}: {e}")
+        log.warning("Error scraping job details from %s: %s", job_url, e)
         return {
             'job_url': job_url,
             'error': str(e)
         }
 
 
+def scrape_job_details_many(
+    job_urls: List[str],
+    linkedin_cookie: str = None,
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Scrape several job postings concurrently
+
+    The per-job wait is network-bound, so a small worker pool over the
+    shared session collapses N serial round trips into roughly
+    N/max_workers. Each fetch takes a LINKEDIN_LIMITER token inside the
+    shared fetch primitive, so concurrency never pushes the request
+    rate past the polite ceiling.
+
+    Args:
+        job_urls: URLs of the job postings
+        linkedin_cookie: Optional LinkedIn session cookie (li_at value)
+        max_workers: Concurrent fetch limit
+
+    Returns:
+        Job detail dicts in input order; failed fetches yield the same
+        error dict scrape_job_details returns
+    """
+    def fetch(job_url):
+        return scrape_job_details(job_url, linkedin_cookie)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(fetch, job_urls))
+
+
 def normalize_job_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize and clean job data, calculate quality metrics
@@ -338,7 +458,7 @@ def normalize_job_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     applicant_count = 0
     applicant_text = norm(raw_data.get('applicant_text', ''))
     if applicant_text:
-        match = re.search(r'\d+', applicant_text)
+        match = _DIGITS.search(applicant_text)
         if match:
             applicant_count = int(match.group(0))
     
@@ -351,13 +471,13 @@ def normalize_job_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         elif 'yesterday' in posted_text:
             days_ago = 1
         elif 'day' in posted_text:
-            match = re.search(r'\d+', posted_text)
+            match = _DIGITS.search(posted_text)
             days_ago = int(match.group(0)) if match else 1
         elif 'week' in posted_text:
-            match = re.search(r'\d+', posted_text)
+            match = _DIGITS.search(posted_text)
             days_ago = (int(match.group(0)) if match else 1) * 7
         elif 'month' in posted_text:
-            match = re.search(r'\d+', posted_text)
+            match = _DIGITS.search(posted_text)
             days_ago = (int(match.group(0)) if match else 1) * 30
     
     # Parse salary range
@@ -365,7 +485,7 @@ def normalize_job_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     max_salary = 0
     salary_text = norm(raw_data.get('salary_text', ''))
     if salary_text:
-        numbers = re.findall(r'\d{1,3}(?:,\d{3})*(?:\.\d+)?', salary_text)
+        numbers = _SALARY_NUM.findall(salary_text)
         if len(numbers) >= 2:
             min_salary = int(float(numbers[0].replace(',', '')))
             max_salary = int(float(numbers[1].replace(',', '')))
@@ -390,48 +510,76 @@ def normalize_job_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def check_quality(job_data: Dict[str, Any], config: Dict[str, Any]) -> tuple:
+@functools.lru_cache(maxsize=32)
+def _lowered(values: tuple) -> tuple:
+    """Lowercased copy of a config list, cached per distinct list"""
+    return tuple(v.lower() for v in values)
+
+
+def check_quality(
+    job_data: Dict[str, Any],
+    config: Dict[str, Any],
+    fast: bool = False
+) -> tuple:
     """
     Check if job meets quality criteria
-    
+
     Args:
         job_data: Normalized job data
         config: Configuration with thresholds
-        
+        fast: Return on the first failing criterion instead of
+              collecting every reason - use in bulk filtering where
+              only pass/fail matters
+
     Returns:
-        Tuple of (passes_quality_check, skip_reason)
+        Tuple of (passes_quality_check, skip_reason); in fast mode
+        skip_reason only names the first failure
     """
     reasons = []
-    
+
     # Check required fields
     if not job_data.get('Title'):
         reasons.append('Missing title')
+        if fast:
+            return False, reasons[0]
     if not job_data.get('Company'):
         reasons.append('Missing company')
+        if fast:
+            return False, reasons[0]
     if len(job_data.get('Description', '')) < config.get('MIN_DESCRIPTION_LENGTH', 50):
         reasons.append('Insufficient description')
-    
+        if fast:
+            return False, reasons[0]
+
     # Check posting age
     days_ago = job_data.get('days_posted_ago', 999)
     max_days = config.get('MAX_DAYS_POSTED', 14)
     if days_ago > max_days:
         reasons.append(f'Posted {days_ago} days ago (>{max_days} days)')
-    
+        if fast:
+            return False, reasons[0]
+
     # Check competition level
     applicant_count = job_data.get('applicant_count_num', 0)
     max_applicants = config.get('MAX_APPLICANTS', 500)
     if applicant_count > max_applicants:
         reasons.append(f'{applicant_count} applicants (>{max_applicants})')
-    
-    # Check excluded companies
-    company = job_data.get('Company', '')
+        if fast:
+            return False, reasons[0]
+
+    # Check excluded companies - company is lowercased once and the
+    # lowercased exclusion list is cached per config, instead of
+    # re-lowercasing both strings on every comparison
+    company_lower = job_data.get('Company', '').lower()
     excluded = config.get('EXCLUDED_COMPANIES', [])
-    for excluded_company in excluded:
-        if excluded_company.lower() in company.lower():
+    for excluded_company, excluded_lower in zip(excluded, _lowered(tuple(excluded))):
+        if excluded_lower in company_lower:
             reasons.append(f'Excluded company: {excluded_company}')
-    
+            if fast:
+                return False, reasons[0]
+
     quality_pass = len(reasons) == 0
     skip_reason = ', '.join(reasons) if reasons else ''
-    
+
     return quality_pass, skip_reason
 
@@ -4,8 +4,48 @@ import json
 import pathlib
 from typing import Optional, Dict, Any, List
 
+import soupsieve as sv
+
 from bs4 import BeautifulSoup
 
+# Compiled once - parse_job_html runs on every scraped job page
+_JOB_ID_SLUG = re.compile(r"/jobs/view/[^/]*-(\d+)")
+_JOB_ID_BARE = re.compile(r"/jobs/view/(\d+)")
+_WS_NL = re.compile(r"\s+\n")
+
+# Selector lists compiled once via soupsieve - extract_first runs these
+# on every parsed page, and a precompiled pattern skips the per-call
+# selector parse/cache lookup
+_TITLE_SELECTORS = [sv.compile(s) for s in (
+    'h1[data-test-id="job-details__job-title"]',
+    "h1.top-card-layout__title",
+    "h1.topcard__title",
+)]
+_COMPANY_SELECTORS = [sv.compile(s) for s in (
+    "a.topcard__org-name-link",
+    "a.top-card-layout__company-url",
+    ".top-card-layout__entity-info .topcard__flavor a",
+    ".topcard__org-name-link",
+    'a[data-tracking-control-name="public_jobs_topcard-org-name"]',
+)]
+_LOCATION_SELECTORS = [sv.compile(s) for s in (
+    ".top-card-layout__entity-info .topcard__flavor--bullet",
+    ".jobs-unified-top-card__bullet",
+    ".topcard__flavor--bullet",
+    'span[data-test-id="job-details__location"]',
+)]
+_POSTED_SELECTORS = [sv.compile(s) for s in (
+    "span.jobs-unified-top-card__posted-date",
+    ".posted-time-ago__text",
+    ".topcard__flavor--metadata",
+    "time",
+)]
+_DESCRIPTION_SELECTORS = [sv.compile(s) for s in (
+    "div.show-more-less-html__markup",
+    "div.jobs-description__content",
+    "section.jobs-description-content__text",
+)]
+
 def _text(el) -> Optional[str]:
     if not el:
         return None
@@ -26,9 +66,9 @@ def extract_meta(soup: BeautifulSoup, prop: str, by: str="property") -> Optional
     tag = soup.find("meta", {by: prop})
     return _attr(tag, "content") if tag else None
 
-def extract_first(soup: BeautifulSoup, selectors: List[str]) -> Optional[str]:
+def extract_first(soup: BeautifulSoup, selectors: List[sv.SoupSieve]) -> Optional[str]:
     for sel in selectors:
-        el = soup.select_one(sel)
+        el = sel.select_one(soup)
         if el:
             t = _text(el)
             if t:
@@ -49,7 +89,7 @@ def parse_job_html(html: str) -> Dict[str, Any]:
 
     job_id = None
     if canonical:
-        m = re.search(r"/jobs/view/[^/]*-(\d+)", canonical) or re.search(r"/jobs/view/(\d+)", canonical)
+        m = _JOB_ID_SLUG.search(canonical) or _JOB_ID_BARE.search(canonical)
         if m:
             job_id = m.group(1)
 
@@ -64,50 +104,23 @@ def parse_job_html(html: str) -> Dict[str, Any]:
     title_id = extract_meta(soup, "titleId", by="name")
 
     # title (robust order)
-    title = (
-        extract_first(soup, [
-            'h1[data-test-id="job-details__job-title"]',
-            "h1.top-card-layout__title",
-            "h1.topcard__title",
-        ])
-        or og_title or page_title
-    )
+    title = extract_first(soup, _TITLE_SELECTORS) or og_title or page_title
 
     # company
-    company = extract_first(soup, [
-        "a.topcard__org-name-link",
-        "a.top-card-layout__company-url",
-        ".top-card-layout__entity-info .topcard__flavor a",
-        ".topcard__org-name-link",
-        'a[data-tracking-control-name="public_jobs_topcard-org-name"]'
-    ])
+    company = extract_first(soup, _COMPANY_SELECTORS)
 
     # location
-    location = extract_first(soup, [
-        ".top-card-layout__entity-info .topcard__flavor--bullet",
-        ".jobs-unified-top-card__bullet",
-        ".topcard__flavor--bullet",
-        'span[data-test-id="job-details__location"]'
-    ])
+    location = extract_first(soup, _LOCATION_SELECTORS)
 
     # posted text / time-ago
-    posted_text = extract_first(soup, [
-        "span.jobs-unified-top-card__posted-date",
-        ".posted-time-ago__text",
-        ".topcard__flavor--metadata",
-        "time"
-    ])
+    posted_text = extract_first(soup, _POSTED_SELECTORS)
 
     # description (expanded markup container)
-    description = extract_first(soup, [
-        "div.show-more-less-html__markup",
-        "div.jobs-description__content",
-        "section.jobs-description-content__text"
-    ])
+    description = extract_first(soup, _DESCRIPTION_SELECTORS)
 
     # plain-text description as fallback (strip repeated whitespace)
     if description:
-        descr_plain = re.sub(r"\s+\n", "\n", description)
+        descr_plain = _WS_NL.sub("\n", description)
     else:
         descr_plain = None
 
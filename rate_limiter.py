@@ -0,0 +1,57 @@
+# rate_limiter.py
+"""Token-bucket rate limiting for outbound API calls
+
+Paces requests below each endpoint's threshold proactively instead of
+detecting 429s after the fact and sleeping. Each remote service gets its
+own bucket because their quotas are independent.
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket refilling continuously at rpm/60 per second"""
+
+    def __init__(self, rpm: int, burst: int = None):
+        """
+        Args:
+            rpm: Sustained requests per minute
+            burst: Max tokens accumulated while idle (default: rpm)
+        """
+        self.rate = rpm / 60.0
+        self.capacity = burst if burst is not None else rpm
+        self.tokens = float(self.capacity)
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1):
+        """Block until the requested tokens are available, then consume them
+
+        Requests larger than the bucket capacity are drained in
+        installments as the bucket refills - the fill level is clamped
+        to capacity, so waiting for it to reach an over-capacity target
+        would block forever.
+        """
+        remaining = float(tokens)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_update) * self.rate
+                )
+                self.last_update = now
+                if self.tokens >= remaining:
+                    self.tokens -= remaining
+                    return
+                remaining -= self.tokens
+                self.tokens = 0.0
+                wait_time = min(remaining, self.capacity) / self.rate
+            time.sleep(wait_time)
+
+
+# Shared per-endpoint limiters
+LINKEDIN_LIMITER = RateLimiter(rpm=20)
+HUNTER_LIMITER = RateLimiter(rpm=30)
+GEMINI_LIMITER = RateLimiter(rpm=60)
+GMAIL_SEND_LIMITER = RateLimiter(rpm=30)
@@ -1,5 +1,6 @@
 # resume_handler.py
 """Handle resume download and text extraction"""
+import functools
 import os
 import io
 import requests
@@ -10,7 +11,19 @@ from google.oauth2.credentials import Credentials
 import PyPDF2
 
 
-def download_resume_from_drive(file_id: str, token_path: str = "token.json") -> bytes:
+@functools.lru_cache(maxsize=2)
+def _drive_service(token_path: str):
+    """Authorized Drive service, built once per token path
+
+    Skips the per-download token.json read and credential parse; the
+    credentials object refreshes itself when the access token expires.
+    cache_discovery=False skips the deprecated file-cache lookup.
+    """
+    creds = Credentials.from_authorized_user_file(token_path)
+    return build('drive', 'v3', credentials=creds, cache_discovery=False)
+
+
+def download_resume_from_drive(file_id: str, token_path: str = "token.json") -> io.BytesIO:
     """
     Download resume PDF from Google Drive
     
@@ -19,55 +32,85 @@ def download_resume_from_drive(file_id: str, token_path: str = "token.json") ->
         token_path: Path to Google OAuth token
         
     Returns:
-        PDF file content as bytes
+        In-memory buffer with the PDF content, positioned at the start
     """
     try:
-        creds = Credentials.from_authorized_user_file(token_path)
-        service = build('drive', 'v3', credentials=creds)
-        
+        service = _drive_service(token_path)
+
         request = service.files().get_media(fileId=file_id)
         file_buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_buffer, request)
-        
+        # 10MB chunks: a multi-MB resume downloads in one or two range
+        # requests instead of dozens at the ~100KB default
+        downloader = MediaIoBaseDownload(
+            file_buffer, request, chunksize=10 * 1024 * 1024
+        )
+
         done = False
         while not done:
             status, done = downloader.next_chunk()
-        
+
         file_buffer.seek(0)
-        return file_buffer.read()
-        
+        return file_buffer
+
     except Exception as e:
         print(f"Error downloading resume from Drive: {e}")
         raise
 
 
-def extract_text_from_pdf(pdf_content: bytes) -> str:
+def _extract_text_from_reader(pdf_reader) -> str:
+    """Join the extracted text of every page that yields any"""
+    text_parts = []
+    for page in pdf_reader.pages:
+        text = page.extract_text()
+        if text:
+            text_parts.append(text)
+
+    return "\n".join(text_parts)
+
+
+def extract_text_from_pdf(pdf_content) -> str:
     """
     Extract text from PDF content
-    
+
     Args:
-        pdf_content: PDF file as bytes
-        
+        pdf_content: PDF file as bytes or a readable binary stream
+        (streams are parsed in place without a second in-memory copy)
+
     Returns:
         Extracted text
     """
     try:
-        pdf_buffer = io.BytesIO(pdf_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_buffer)
-        
-        text_parts = []
-        for page in pdf_reader.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-        
-        return "\n".join(text_parts)
-        
+        if isinstance(pdf_content, bytes):
+            pdf_content = io.BytesIO(pdf_content)
+        return _extract_text_from_reader(PyPDF2.PdfReader(pdf_content))
+
     except Exception as e:
         print(f"Error extracting text from PDF: {e}")
         return ""
 
 
+def extract_text_from_file(pdf_path: str) -> str:
+    """
+    Extract text from a PDF on disk
+
+    PdfReader seeks around the open file handle directly, so the PDF is
+    never slurped into a bytes object and re-wrapped first.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Extracted text
+    """
+    try:
+        with open(pdf_path, 'rb') as f:
+            return _extract_text_from_reader(PyPDF2.PdfReader(f))
+
+    except Exception as e:
+        print(f"Error extracting text from {pdf_path}: {e}")
+        return ""
+
+
 def get_resume_text(file_id: str, cache_path: str = "resume_cache.txt", local_pdf: str = "resume.pdf") -> str:
     """
     Get resume text, using cache if available
@@ -95,10 +138,8 @@ def get_resume_text(file_id: str, cache_path: str = "resume_cache.txt", local_pd
     if os.path.exists(local_pdf):
         print(f"  Found local resume file: {local_pdf}")
         try:
-            with open(local_pdf, 'rb') as f:
-                pdf_content = f.read()
-            resume_text = extract_text_from_pdf(pdf_content)
-            
+            resume_text = extract_text_from_file(local_pdf)
+
             # Cache for future use
             with open(cache_path, 'w', encoding='utf-8') as f:
                 f.write(resume_text)
@@ -0,0 +1,319 @@
+# scoring_cache.py
+"""Two-tier cache for Gemini scoring responses
+
+Tier 1 is an exact SHA256 lookup keyed on (resume, job description) in a
+small SQLite KV store. Tier 2 is a semantic match: cached job-description
+embeddings for the same resume are compared against the incoming
+description and a stored result is reused when cosine similarity exceeds
+SIMILARITY_THRESHOLD - scores are judgments about one resume, so entries
+written for a different resume are never candidates.
+Cross-posted and duplicate listings are common, so a hit returns in ~1ms
+instead of a multi-second Gemini round trip.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Optional
+
+# Optional dependency - tier 2 is disabled without numpy
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import embedding_gate
+
+CACHE_DB_PATH = os.path.join('databases', 'scoring_cache.db')
+SIMILARITY_THRESHOLD = 0.9
+EMBEDDING_DIM = 384  # all-MiniLM-L6-v2
+EXPIRY_DAYS = 7  # scoring entries; job postings churn quickly
+HUNTER_TTL = '-30 days'           # resolved domains/emails go stale slowly
+HUNTER_NEGATIVE_TTL = '-1 day'    # retry companies with no email after a day
+
+_conn = None
+_emb_matrix = None  # cached description embeddings, one row per entry
+_emb_keys = []      # cache_key for each matrix row
+
+
+def make_key(resume_text: str, description: str) -> str:
+    """Build the exact-match cache key for a (resume, description) pair"""
+    return (
+        hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+        + hashlib.sha256(description.encode('utf-8')).hexdigest()
+    )
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Get (and lazily create) the cache database connection"""
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(CACHE_DB_PATH), exist_ok=True)
+        _conn = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS scoring_cache (
+                cache_key TEXT PRIMARY KEY,
+                embedding BLOB,
+                scoring_json TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS company_domains (
+                company TEXT PRIMARY KEY,
+                domain TEXT NOT NULL,
+                resolved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS letter_cache (
+                cache_key TEXT PRIMARY KEY,
+                letter TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS hunter_cache (
+                company TEXT PRIMARY KEY,
+                domain TEXT,
+                email TEXT,
+                ts TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # Expiry sweep once per process - stale scores for reposted jobs
+        # age out rather than accumulating forever
+        _conn.execute(
+            "DELETE FROM scoring_cache WHERE created_at < datetime('now', ?)",
+            (f'-{EXPIRY_DAYS} days',)
+        )
+        _conn.execute(
+            "DELETE FROM letter_cache WHERE created_at < datetime('now', ?)",
+            (f'-{EXPIRY_DAYS} days',)
+        )
+        _conn.commit()
+    return _conn
+
+
+def _load_embeddings():
+    """Load cached embeddings into the in-memory similarity matrix"""
+    global _emb_matrix, _emb_keys
+    if _emb_matrix is not None or np is None:
+        return
+
+    conn = _get_conn()
+    rows = conn.execute(
+        "SELECT cache_key, embedding FROM scoring_cache WHERE embedding IS NOT NULL"
+    ).fetchall()
+
+    _emb_keys = [row[0] for row in rows]
+    if rows:
+        _emb_matrix = np.vstack(
+            [np.frombuffer(row[1], dtype=np.float32) for row in rows]
+        )
+    else:
+        _emb_matrix = np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+
+
+def lookup(cache_key: str, description: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached scoring result
+
+    Args:
+        cache_key: Key from make_key()
+        description: Job description (used for the semantic tier)
+
+    Returns:
+        Cached scoring data, or None on miss
+    """
+    conn = _get_conn()
+
+    # Tier 1: exact hash hit
+    row = conn.execute(
+        "SELECT scoring_json FROM scoring_cache WHERE cache_key = ?",
+        (cache_key,)
+    ).fetchone()
+    if row:
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            pass
+
+    # Tier 2: semantic match against cached description embeddings
+    if np is None or not embedding_gate.gate_available():
+        return None
+
+    _load_embeddings()
+    if _emb_matrix is None or not _emb_keys:
+        return None
+
+    # Only entries written for this resume are candidates - the key is
+    # resume hash + description hash, and reusing another resume's score
+    # for a similar description would hand user A's judgment to user B
+    resume_hash = cache_key[:64]
+    candidate_rows = [
+        i for i, key in enumerate(_emb_keys) if key.startswith(resume_hash)
+    ]
+    if not candidate_rows:
+        return None
+
+    encoded = embedding_gate.embed_texts([description])
+    if encoded is None:
+        return None
+
+    emb = np.asarray(encoded[0], dtype=np.float32)
+    sims = _emb_matrix[candidate_rows] @ emb
+    best = int(sims.argmax())
+    if float(sims[best]) >= SIMILARITY_THRESHOLD:
+        row = conn.execute(
+            "SELECT scoring_json FROM scoring_cache WHERE cache_key = ?",
+            (_emb_keys[candidate_rows[best]],)
+        ).fetchone()
+        if row:
+            try:
+                return json.loads(row[0])
+            except json.JSONDecodeError:
+                pass
+
+    return None
+
+
+def store(cache_key: str, description: str, scoring_data: Dict[str, Any]):
+    """
+    Store a scoring result in both cache tiers
+
+    Args:
+        cache_key: Key from make_key()
+        description: Job description (embedded for the semantic tier)
+        scoring_data: Scoring result to cache
+    """
+    global _emb_matrix
+
+    emb = None
+    emb_blob = None
+    if np is not None and embedding_gate.gate_available():
+        encoded = embedding_gate.embed_texts([description])
+        if encoded is not None:
+            emb = np.asarray(encoded[0], dtype=np.float32)
+            emb_blob = emb.tobytes()
+
+    conn = _get_conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO scoring_cache (cache_key, embedding, scoring_json) VALUES (?, ?, ?)",
+        (cache_key, emb_blob, json.dumps(scoring_data))
+    )
+    conn.commit()
+
+    # Keep the in-memory matrix in sync for subsequent lookups
+    if emb is not None:
+        _load_embeddings()
+        _emb_matrix = np.vstack([_emb_matrix, emb])
+        _emb_keys.append(cache_key)
+
+
+def lookup_letter(cache_key: str) -> Optional[str]:
+    """
+    Look up a cached cover letter
+
+    Args:
+        cache_key: SHA256 over the letter prompt inputs + model name
+
+    Returns:
+        Cached letter HTML, or None on miss
+    """
+    conn = _get_conn()
+    row = conn.execute(
+        "SELECT letter FROM letter_cache WHERE cache_key = ?",
+        (cache_key,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def store_letter(cache_key: str, letter: str):
+    """
+    Store a generated cover letter
+
+    Args:
+        cache_key: SHA256 over the letter prompt inputs + model name
+        letter: Generated letter HTML
+    """
+    conn = _get_conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO letter_cache (cache_key, letter) VALUES (?, ?)",
+        (cache_key, letter)
+    )
+    conn.commit()
+
+
+def lookup_hunter(company_name: str):
+    """
+    Look up a cached Hunter.io result for a company
+
+    Empty-email rows act as a negative cache with a much shorter TTL so
+    dead companies are retried after a day instead of hammered every run.
+
+    Args:
+        company_name: Company name
+
+    Returns:
+        (domain, email) tuple, or None on miss/expiry
+    """
+    conn = _get_conn()
+    row = conn.execute("""
+        SELECT domain, email FROM hunter_cache
+        WHERE company = ?
+          AND ((email != '' AND ts > datetime('now', ?))
+               OR (email = '' AND ts > datetime('now', ?)))
+    """, (company_name.strip().lower(), HUNTER_TTL, HUNTER_NEGATIVE_TTL)).fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def store_hunter(company_name: str, domain: str, email: str):
+    """
+    Store a Hunter.io lookup result (including empty-email misses)
+
+    Args:
+        company_name: Company name
+        domain: Resolved domain ('' when unresolved)
+        email: Found email ('' when none found)
+    """
+    conn = _get_conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO hunter_cache (company, domain, email, ts) "
+        "VALUES (?, ?, ?, CURRENT_TIMESTAMP)",
+        (company_name.strip().lower(), domain or '', email or '')
+    )
+    conn.commit()
+
+
+def lookup_company_domain(company_name: str) -> Optional[str]:
+    """
+    Look up a previously resolved company domain
+
+    Args:
+        company_name: Company name
+
+    Returns:
+        Cached domain, or None on miss
+    """
+    conn = _get_conn()
+    row = conn.execute(
+        "SELECT domain FROM company_domains WHERE company = ?",
+        (company_name.strip().lower(),)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def store_company_domain(company_name: str, domain: str):
+    """
+    Store a resolved company domain
+
+    Args:
+        company_name: Company name
+        domain: Resolved domain (e.g. 'example.com')
+    """
+    conn = _get_conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO company_domains (company, domain) VALUES (?, ?)",
+        (company_name.strip().lower(), domain)
+    )
+    conn.commit()
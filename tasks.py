@@ -0,0 +1,51 @@
+# tasks.py
+"""Background automation tasks
+
+Automation runs are enqueued onto an RQ (Redis) queue so they execute in
+separate worker processes instead of daemon threads competing with Flask
+under the GIL. Start workers with:
+
+    rq worker automation
+
+Redis/RQ are optional - when they aren't available the Flask app falls
+back to running the task on an in-process thread as before.
+"""
+import os
+
+try:
+    from redis import Redis
+    from rq import Queue
+except ImportError:
+    Redis = None
+    Queue = None
+
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+QUEUE_NAME = 'automation'
+
+
+def get_queue():
+    """
+    Get the automation RQ queue
+
+    Returns:
+        Queue connected to Redis, or None when Redis/RQ are unavailable
+        (callers should fall back to an in-process thread)
+    """
+    if Queue is None:
+        return None
+
+    try:
+        connection = Redis.from_url(REDIS_URL)
+        connection.ping()
+        return Queue(QUEUE_NAME, connection=connection)
+    except Exception as e:
+        print(f"RQ unavailable, falling back to in-process thread: {e}")
+        return None
+
+
+def run_automation_task(user_id, run_id):
+    """RQ entry point - runs the automation pipeline for one job run"""
+    # Imported here so RQ workers pull in the Flask app lazily and the
+    # app itself never imports this module at startup
+    from app import run_automation_task as _run_automation_task
+    _run_automation_task(user_id, run_id)